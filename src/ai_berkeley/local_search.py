@@ -1,6 +1,11 @@
 import random
 import math
-from typing import Callable, TypeVar, List, Tuple, Any
+from typing import Callable, TypeVar, List, Tuple, Any, Optional, Union
+
+from ..local_search.budget import MAX_ITERATIONS, Budget, BudgetTracker, start_budget
+from ..local_search.history import ValueHistory, new_history
+from ..local_search.moves import (annealing_moves, first_choice_moves, is_move_problem,
+                                  steepest_moves)
 
 State = TypeVar('State')
 
@@ -8,17 +13,31 @@ def hill_climbing_steepest(
     initial_state: State,
     get_neighbors: Callable[[State], List[State]],
     evaluate: Callable[[State], float],
-    max_iterations: int = 1000
-) -> Tuple[State, List[float]]:
+    max_iterations: int = 1000,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[State, ValueHistory]:
     """
     Steepest-ascent hill climbing algorithm.
-    Returns the best state found and the history of values.
+    Returns the best state found and the history of values, filtered by the
+    record mode (see local_search.history). budget bounds the run on top of
+    max_iterations (see local_search.budget).
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    if is_move_problem(get_neighbors):
+        return steepest_moves(initial_state, get_neighbors, evaluate, record, tracker,
+                              max_iterations)
+
     current = initial_state
     current_value = evaluate(current)
-    value_history = [current_value]
+    value_history = new_history(record)
+    value_history.append(current_value)
     
+    stop_reason = 'local_optimum'
     for _ in range(max_iterations):
+        if not tracker.next_iteration():
+            break
         neighbors = get_neighbors(current)
         if not neighbors:
             break
@@ -33,24 +52,41 @@ def hill_climbing_steepest(
         current = best_neighbor
         current_value = best_value
         value_history.append(current_value)
+    else:
+        stop_reason = MAX_ITERATIONS
     
+    value_history.stop_reason = tracker.stop_reason or stop_reason
     return current, value_history
 
 def hill_climbing_first_choice(
     initial_state: State,
     get_neighbors: Callable[[State], List[State]],
     evaluate: Callable[[State], float],
-    max_iterations: int = 1000
-) -> Tuple[State, List[float]]:
+    max_iterations: int = 1000,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[State, ValueHistory]:
     """
     First-choice hill climbing algorithm.
-    Returns the best state found and the history of values.
+    Returns the best state found and the history of values, filtered by the
+    record mode (see local_search.history). budget bounds the run on top of
+    max_iterations (see local_search.budget).
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    if is_move_problem(get_neighbors):
+        return first_choice_moves(initial_state, get_neighbors, evaluate, record, tracker,
+                                  max_iterations)
+
     current = initial_state
     current_value = evaluate(current)
-    value_history = [current_value]
+    value_history = new_history(record)
+    value_history.append(current_value)
     
+    stop_reason = 'local_optimum'
     for _ in range(max_iterations):
+        if not tracker.next_iteration():
+            break
         neighbors = get_neighbors(current)
         if not neighbors:
             break
@@ -71,7 +107,10 @@ def hill_climbing_first_choice(
                 
         if not found_better:
             break
+    else:
+        stop_reason = MAX_ITERATIONS
     
+    value_history.stop_reason = tracker.stop_reason or stop_reason
     return current, value_history
 
 def hill_climbing_random_restart(
@@ -80,31 +119,41 @@ def hill_climbing_random_restart(
     evaluate: Callable[[State], float],
     generate_state: Callable[[], State],
     max_restarts: int = 10,
-    max_iterations: int = 1000
-) -> Tuple[State, List[float]]:
+    max_iterations: int = 1000,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[State, ValueHistory]:
     """
     Random-restart hill climbing algorithm.
     Returns the best state found across all restarts and the history of values.
+    Every restart records into the same history and draws on one budget.
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
     best_state = initial_state
     best_value = evaluate(best_state)
-    value_history = [best_value]
+    value_history = new_history(record)
+    value_history.append(best_value)
     
     for _ in range(max_restarts):
         current_state = generate_state()
-        current_state, current_history = hill_climbing_steepest(
+        current_state, _ = hill_climbing_steepest(
             current_state,
             get_neighbors,
             evaluate,
-            max_iterations
+            max_iterations,
+            value_history,
+            tracker
         )
         current_value = evaluate(current_state)
-        value_history.extend(current_history)
         
         if current_value > best_value:
             best_state = current_state
             best_value = current_value
+        if tracker.stop_reason:
+            break
     
+    value_history.stop_reason = tracker.stop_reason or 'restarts'
     return best_state, value_history
 
 def simulated_annealing(
@@ -112,28 +161,50 @@ def simulated_annealing(
     get_neighbors: Callable[[State], List[State]],
     evaluate: Callable[[State], float],
     temperature_schedule: Callable[[int], float],
-    max_iterations: int = 1000
-) -> Tuple[State, List[float]]:
+    max_iterations: int = 1000,
+    random_neighbor: Optional[Callable[[State, Any], State]] = None,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[State, ValueHistory]:
     """
     Simulated annealing algorithm.
-    Returns the best state found and the history of values.
+    Returns the best state found and the history of values, filtered by the
+    record mode (see local_search.history).
+    If random_neighbor(state, rng) is given, it draws the candidate directly
+    instead of choosing from the full get_neighbors list.
+    budget bounds the run on top of max_iterations (see local_search.budget).
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    if is_move_problem(get_neighbors):
+        return annealing_moves(initial_state, get_neighbors, evaluate, temperature_schedule,
+                               record, tracker, range(max_iterations), MAX_ITERATIONS,
+                               return_best=True)
+
     current = initial_state
     current_value = evaluate(current)
     best_state = current
     best_value = current_value
-    value_history = [current_value]
+    value_history = new_history(record)
+    value_history.append(current_value)
     
+    stop_reason = 'schedule'
     for t in range(max_iterations):
+        if not tracker.next_iteration():
+            break
         temperature = temperature_schedule(t)
         if temperature == 0:
             break
             
-        neighbors = get_neighbors(current)
-        if not neighbors:
-            break
-            
-        next_state = random.choice(neighbors)
+        if random_neighbor is not None:
+            next_state = random_neighbor(current, random)
+            if next_state is None:
+                break
+        else:
+            neighbors = get_neighbors(current)
+            if not neighbors:
+                break
+            next_state = random.choice(neighbors)
         next_value = evaluate(next_state)
         
         # Calculate change in value
@@ -149,7 +220,10 @@ def simulated_annealing(
             if current_value > best_value:
                 best_state = current
                 best_value = current_value
+    else:
+        stop_reason = MAX_ITERATIONS
     
+    value_history.stop_reason = tracker.stop_reason or stop_reason
     return best_state, value_history
 
 def exponential_schedule(k: float = 20, lam: float = 0.005, limit: int = 1000) -> Callable[[int], float]:
@@ -6,6 +6,8 @@ then create problem instances and solve them with calls to the various search
 functions.
 """
 
+import heapq
+import itertools
 import sys
 from collections import deque
 import time
@@ -62,6 +64,21 @@ class Problem:
         and related algorithms try to maximize this value."""
         raise NotImplementedError
 
+    def report_frontier(self, frontier_size, explored_size):
+        """Called by the graph searches after every expansion with the
+        current sizes of the frontier and the explored set. Does nothing by
+        default; InstrumentedProblem overrides it to keep the peaks."""
+        pass
+
+    def reverse(self):
+        """Return the problem of searching backwards from self.goal to
+        self.initial, used by bidirectional_search. Its actions must undo
+        this problem's at the same cost, and its h must estimate the
+        distance to self.initial. Override this in reversible problems
+        with a single goal."""
+        raise NotImplementedError(
+            "{} cannot be reversed; pass a reverse_problem".format(type(self).__name__))
+
 
 # ______________________________________________________________________________
 
@@ -74,7 +91,11 @@ class Node:
     the total path_cost (also known as g) to reach the node. Other functions
     may add an f and h value; see best_first_graph_search and astar_search for
     an explanation of how the f and h values are handled. You will not need to
-    subclass this class."""
+    subclass this class.
+    Nodes have no __dict__: f and h are reserved slots that stay unset until
+    memoize (or a search such as recursive_best_first_search) fills them."""
+
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth', 'f', 'h')
 
     def __init__(self, state, parent=None, action=None, path_cost=0):
         """Create a search tree Node, derived from a parent by an action."""
@@ -82,9 +103,7 @@ class Node:
         self.parent = parent
         self.action = action
         self.path_cost = path_cost
-        self.depth = 0
-        if parent:
-            self.depth = parent.depth + 1
+        self.depth = parent.depth + 1 if parent else 0
 
     def __repr__(self):
         return "<Node {}>".format(self.state)
@@ -97,6 +116,16 @@ class Node:
         return [self.child_node(problem, action)
                 for action in problem.actions(self.state)]
 
+    def expand_iter(self, problem, reverse=False):
+        """Generate the nodes reachable in one step from this node, one at a
+        time, so a search that stops early never builds the rest. With
+        reverse=True the actions are tried last first."""
+        actions = problem.actions(self.state)
+        if reverse:
+            actions = reversed(list(actions))
+        for action in actions:
+            yield self.child_node(problem, action)
+
     def child_node(self, problem, action):
         """[Figure 3.10]"""
         next_state = problem.result(self.state, action)
@@ -191,7 +220,7 @@ def breadth_first_tree_search(problem):
         node = frontier.popleft()
         if problem.goal_test(node.state):
             return node
-        frontier.extend(node.expand(problem))
+        frontier.extend(node.expand_iter(problem))
     return None
 
 
@@ -204,13 +233,19 @@ def depth_first_tree_search(problem):
     Repeats infinitely in case of loops.
     """
 
-    frontier = [Node(problem.initial)]  # Stack
+    # Stack of child generators, one per level: only one untried child is
+    # built at a time. Children come last first, in the order a stack of
+    # fully expanded nodes would pop them.
+    frontier = [iter([Node(problem.initial)])]
 
     while frontier:
-        node = frontier.pop()
+        node = next(frontier[-1], None)
+        if node is None:
+            frontier.pop()
+            continue
         if problem.goal_test(node.state):
             return node
-        frontier.extend(node.expand(problem))
+        frontier.append(node.expand_iter(problem, reverse=True))
     return None
 
 
@@ -225,14 +260,17 @@ def depth_first_graph_search(problem):
     """
     frontier = [(Node(problem.initial))]  # Stack
 
-    explored = set()
+    # States explored or on the frontier, so one lookup checks both
+    reached = {problem.initial}
     while frontier:
         node = frontier.pop()
         if problem.goal_test(node.state):
             return node
-        explored.add(node.state)
-        frontier.extend(child for child in node.expand(problem)
-                        if child.state not in explored and child not in frontier)
+        for child in node.expand_iter(problem):
+            if child.state not in reached:
+                reached.add(child.state)
+                frontier.append(child)
+        problem.report_frontier(len(frontier), len(reached) - len(frontier))
     return None
 
 
@@ -246,29 +284,38 @@ def breadth_first_graph_search(problem):
     if problem.goal_test(node.state):
         return node
     frontier = deque([node])
-    explored = set()
+    # States explored or on the frontier, so one lookup checks both
+    reached = {node.state}
     while frontier:
         node = frontier.popleft()
-        explored.add(node.state)
-        for child in node.expand(problem):
-            if child.state not in explored and child not in frontier:
+        for child in node.expand_iter(problem):
+            if child.state not in reached:
                 if problem.goal_test(child.state):
                     return child
+                reached.add(child.state)
                 frontier.append(child)
+        problem.report_frontier(len(frontier), len(reached) - len(frontier))
     return None
 
 
-def best_first_graph_search(problem, f, display=False, timeout=10):
+def best_first_graph_search(problem, f, display=False, timeout=10, queue='heap'):
     """Search the nodes with the lowest f(node) value first.
     You specify the function f(node) that you want to minimize; for example,
     if f is a heuristic estimate to the goal, then we have greedy best
     first search; if f is node.depth then we have breadth-first search.
     There is a subtlety: the line "f = memoize(f, 'f')" means that the f
     values will be cached on the nodes as they are computed. So after doing
-    a best first search you can examine the f values of the path returned."""
+    a best first search you can examine the f values of the path returned.
+    With queue='bucket' the frontier is a BucketQueue, which needs integer
+    f values and breaks ties in favour of the deepest path_cost."""
     f = memoize(f, 'f')
     node = Node(problem.initial)
-    frontier = PriorityQueue('min', f)
+    if queue == 'heap':
+        frontier = PriorityQueue('min', f)
+    elif queue == 'bucket':
+        frontier = BucketQueue(f, lambda n: n.path_cost)
+    else:
+        raise ValueError("Queue must be either 'heap' or 'bucket'.")
     frontier.append(node)
     explored = set()
     start_time = time.time()
@@ -281,13 +328,14 @@ def best_first_graph_search(problem, f, display=False, timeout=10):
         if problem.goal_test(node.state):
             return node
         explored.add(node.state)
-        for child in node.expand(problem):
+        for child in node.expand_iter(problem):
             if child.state not in explored and child not in frontier:
                 frontier.append(child)
             elif child in frontier:
                 if f(child) < frontier[child]:
                     del frontier[child]
                     frontier.append(child)
+        problem.report_frontier(len(frontier), len(explored))
     return None
 
 
@@ -296,33 +344,97 @@ def uniform_cost_search(problem, display=False):
     return best_first_graph_search(problem, lambda node: node.path_cost, display)
 
 
-def depth_limited_search(problem, limit=50):
-    """[Figure 3.17]"""
+# Returned by depth_limited_search when the depth limit cut off the search
+CUTOFF = 'cutoff'
 
-    def recursive_dls(node, problem, limit):
-        if problem.goal_test(node.state):
-            return node
-        elif limit == 0:
-            return 'cutoff'
-        else:
-            cutoff_occurred = False
-            for child in node.expand(problem):
-                result = recursive_dls(child, problem, limit - 1)
-                if result == 'cutoff':
-                    cutoff_occurred = True
-                elif result is not None:
-                    return result
-            return 'cutoff' if cutoff_occurred else None
 
-    # Body of depth_limited_search:
-    return recursive_dls(Node(problem.initial), problem, limit)
+class TranspositionTable:
+    """Shallowest depth at which each state was reached during one iteration
+    of depth_limited_search. A state reached again at the same or a greater
+    depth has nothing new below it within the limit and is skipped. Holds at
+    most maxsize states (None for no bound); once full it only updates the
+    states it already holds, which keeps the pruning sound."""
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.depths = {}
+        self.hits = 0
+
+    def visit(self, state, depth):
+        """Record state at depth; return False if it was already reached at
+        a depth no greater than this one."""
+        seen = self.depths.get(state)
+        if seen is not None and seen <= depth:
+            self.hits += 1
+            return False
+        if seen is not None or self.maxsize is None or len(self.depths) < self.maxsize:
+            self.depths[state] = depth
+        return True
+
+    def clear(self):
+        self.depths.clear()
+        self.hits = 0
+
+
+def depth_limited_search(problem, limit=50, table=None, stats=None):
+    """[Figure 3.17]
+    Runs on an explicit stack of child generators instead of recursion, so
+    deep limits do not hit the recursion limit. A child with the same state
+    as its grandparent (a move undone) is never searched. With a
+    TranspositionTable, states already reached at no greater depth are
+    skipped too. Returns the goal node, CUTOFF ('cutoff') if the limit cut
+    off part of the search, or None. If a stats dict is given, it is filled
+    with the node counters of the search."""
+    expanded = pruned = 0
+    cutoff_occurred = False
+    result = None
+    hits_before = table.hits if table is not None else 0
+    frontier = [iter([Node(problem.initial)])]
+    while frontier:
+        node = next(frontier[-1], None)
+        if node is None:
+            frontier.pop()
+            continue
+        parent = node.parent
+        if parent is not None and parent.parent is not None and node.state == parent.parent.state:
+            pruned += 1
+            continue
+        if table is not None and not table.visit(node.state, node.depth):
+            continue
+        if problem.goal_test(node.state):
+            result = node
+            break
+        if node.depth == limit:
+            cutoff_occurred = True
+            continue
+        expanded += 1
+        frontier.append(node.expand_iter(problem))
+
+    if stats is not None:
+        stats.update({
+            'Depth Limit': limit,
+            'Nodes Expanded': expanded,
+            'Parent Prunes': pruned,
+            'Transposition Hits': table.hits - hits_before if table is not None else 0,
+        })
+    if result is not None:
+        return result
+    return CUTOFF if cutoff_occurred else None
 
 
-def iterative_deepening_search(problem):
-    """[Figure 3.18]"""
+def iterative_deepening_search(problem, table=None, stats=None):
+    """[Figure 3.18]
+    Depth-limited search with limits 0, 1, 2, ... A TranspositionTable is
+    cleared before each iteration. If a stats list is given, one dict of
+    node counters is appended to it per iteration."""
     for depth in range(sys.maxsize):
-        result = depth_limited_search(problem, depth)
-        if result != 'cutoff':
+        if table is not None:
+            table.clear()
+        iteration = {} if stats is not None else None
+        result = depth_limited_search(problem, depth, table, iteration)
+        if stats is not None:
+            stats.append(iteration)
+        if result is not CUTOFF:
             return result
 
 
@@ -330,80 +442,138 @@ def iterative_deepening_search(problem):
 # Bidirectional Search
 # Pseudocode from https://webdocs.cs.ualberta.ca/%7Eholte/Publications/MM-AAAI2016.pdf
 
-def bidirectional_search(problem):
+class _MMOpenList:
+    """Open list of one direction of bidirectional_search. Nodes are indexed
+    by state for O(1) membership and removal; three heaps hold the MM
+    priority max(f, 2g) (ties broken on smaller g), f and g. Removed or
+    re-queued entries stay in the heaps and are dropped lazily when they
+    reach the top."""
+
+    def __init__(self, h):
+        self.h = h
+        self.nodes = {}  # state -> (node, g)
+        self.by_priority, self.by_f, self.by_g = [], [], []
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, state):
+        return state in self.nodes
+
+    def __getitem__(self, state):
+        return self.nodes[state][0]
+
+    def push(self, node, g):
+        f = g + self.h(node)
+        count = next(self.counter)
+        self.nodes[node.state] = (node, g)
+        heapq.heappush(self.by_priority, (max(f, 2 * g), g, count, node.state))
+        heapq.heappush(self.by_f, (f, g, count, node.state))
+        heapq.heappush(self.by_g, (g, g, count, node.state))
+
+    def remove(self, state):
+        del self.nodes[state]
+
+    def top(self, heap):
+        """Return the first live entry of heap, or None."""
+        while heap:
+            _, g, _, state = heap[0]
+            entry = self.nodes.get(state)
+            if entry is not None and entry[1] == g:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def min_value(self, heap):
+        entry = self.top(heap)
+        return entry[0] if entry is not None else np.inf
+
+    def pop(self):
+        """Remove and return (node, g) of minimum priority."""
+        state = self.top(self.by_priority)[3]
+        return self.nodes.pop(state)
+
+
+def bidirectional_search(problem, reverse_problem=None):
+    """Bidirectional MM search: it meets in the middle, expanding the node
+    of lowest priority max(g + h, 2g) in either direction. The backward
+    search expands reverse_problem from problem.goal, and its heuristic is
+    reverse_problem.h, which must estimate the distance to problem.initial.
+    By default reverse_problem is problem.reverse(), which EightPuzzle,
+    undirected GraphProblems and InstrumentedProblem provide; an
+    InstrumentedProblem adds the backward search's counts to its own.
+    Problems that cannot be reversed raise NotImplementedError, and
+    instances that cannot be (a directed graph, a custom heuristic) raise
+    ValueError.
+    Returns the goal node of a shortest path, like astar_search, or None if
+    there is none."""
     e = 0
     if isinstance(problem, GraphProblem):
         e = problem.find_min_edge()
-    gF, gB = {Node(problem.initial): 0}, {Node(problem.goal): 0}
-    openF, openB = [Node(problem.initial)], [Node(problem.goal)]
-    closedF, closedB = [], []
+    if problem.goal_test(problem.initial):
+        return Node(problem.initial)
+    instrumented = None
+    if reverse_problem is None:
+        reverse_problem = problem.reverse()
+        if isinstance(problem, InstrumentedProblem):
+            instrumented = problem
+
+    gF, gB = {problem.initial: 0}, {problem.goal: 0}
+    openF, openB = _MMOpenList(problem.h), _MMOpenList(reverse_problem.h)
+    openF.push(Node(problem.initial), 0)
+    openB.push(Node(problem.goal), 0)
     U = np.inf
+    meeting = None  # (forward node, backward node) of the best path found
 
-    def extend(U, open_dir, open_other, g_dir, g_other, closed_dir):
+    def extend(U, meeting, dir_problem, open_dir, open_other, g_dir, g_other, forward):
         """Extend search in given direction"""
-        n = find_key(C, open_dir, g_dir)
-
-        open_dir.remove(n)
-        closed_dir.append(n)
+        n, g_n = open_dir.pop()
 
-        for c in n.expand(problem):
-            if c in open_dir or c in closed_dir:
-                if g_dir[c] <= problem.path_cost(g_dir[n], n.state, None, c.state):
+        for c in n.expand_iter(dir_problem):
+            g_c = dir_problem.path_cost(g_n, n.state, c.action, c.state)
+            if c.state in g_dir:
+                if g_dir[c.state] <= g_c:
                     continue
+                if c.state in open_dir:
+                    open_dir.remove(c.state)
 
-                open_dir.remove(c)
-
-            g_dir[c] = problem.path_cost(g_dir[n], n.state, None, c.state)
-            open_dir.append(c)
-
-            if c in open_other:
-                U = min(U, g_dir[c] + g_other[c])
-
-        return U, open_dir, closed_dir, g_dir
+            g_dir[c.state] = g_c
+            open_dir.push(c, g_c)
 
-    def find_min(open_dir, g):
-        """Finds minimum priority, g and f values in open_dir"""
-        # pr_min_f isn't forward pr_min instead it's the f-value
-        # of node with priority pr_min.
-        pr_min, pr_min_f = np.inf, np.inf
-        for n in open_dir:
-            f = g[n] + problem.h(n)
-            pr = max(f, 2 * g[n])
-            pr_min = min(pr_min, pr)
-            pr_min_f = min(pr_min_f, f)
+            if c.state in open_other and g_c + g_other[c.state] < U:
+                U = g_c + g_other[c.state]
+                other = open_other[c.state]
+                meeting = (c, other) if forward else (other, c)
 
-        return pr_min, pr_min_f, min(g.values())
-
-    def find_key(pr_min, open_dir, g):
-        """Finds key in open_dir with value equal to pr_min
-        and minimum g value."""
-        m = np.inf
-        node = Node(-1)
-        for n in open_dir:
-            pr = max(g[n] + problem.h(n), 2 * g[n])
-            if pr == pr_min:
-                if g[n] < m:
-                    m = g[n]
-                    node = n
-
-        return node
+        return U, meeting
 
     while openF and openB:
-        pr_min_f, f_min_f, g_min_f = find_min(openF, gF)
-        pr_min_b, f_min_b, g_min_b = find_min(openB, gB)
+        pr_min_f, pr_min_b = openF.min_value(openF.by_priority), openB.min_value(openB.by_priority)
         C = min(pr_min_f, pr_min_b)
 
-        if U <= max(C, f_min_f, f_min_b, g_min_f + g_min_b + e):
-            return U
+        if U <= max(C, openF.min_value(openF.by_f), openB.min_value(openB.by_f),
+                    openF.min_value(openF.by_g) + openB.min_value(openB.by_g) + e):
+            break
 
         if C == pr_min_f:
             # Extend forward
-            U, openF, closedF, gF = extend(U, openF, openB, gF, gB, closedF)
+            U, meeting = extend(U, meeting, problem, openF, openB, gF, gB, True)
         else:
             # Extend backward
-            U, openB, closedB, gB = extend(U, openB, openF, gB, gF, closedB)
+            U, meeting = extend(U, meeting, reverse_problem, openB, openF, gB, gF, False)
 
-    return np.inf
+    if instrumented is not None:
+        instrumented.add_counts(reverse_problem)
+    if meeting is None:
+        return None
+    # Follow the backward path from the meeting state to the goal, forwards
+    node, backward = meeting
+    for next_node in reversed(backward.path()[:-1]):
+        action = next(action for action in problem.actions(node.state)
+                      if problem.result(node.state, action) == next_node.state)
+        node = node.child_node(problem, action)
+    return node
 
 
 # ______________________________________________________________________________
@@ -416,12 +586,13 @@ greedy_best_first_graph_search = best_first_graph_search
 # Greedy best-first search is accomplished by specifying f(n) = h(n).
 
 
-def astar_search(problem, h=None, display=False, timeout=10):
+def astar_search(problem, h=None, display=False, timeout=10, queue='heap'):
     """A* search is best-first graph search with f(n) = g(n)+h(n).
     You need to specify the h function when you call astar_search, or
-    else in your Problem subclass."""
+    else in your Problem subclass. Unit-cost problems with integer h can
+    pass queue='bucket' (see best_first_graph_search)."""
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), display)
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), display, queue=queue)
 
 
 # ______________________________________________________________________________
@@ -436,6 +607,11 @@ class EightPuzzle(Problem):
         """ Define goal state and initialize a problem """
         super().__init__(initial, goal)
 
+    def reverse(self):
+        """ Moves are reversible, so the backward problem swaps initial and goal """
+
+        return EightPuzzle(self.goal, self.initial)
+
     def find_blank_square(self, state):
         """Return the index of the blank square in a given state"""
 
@@ -604,35 +780,86 @@ class PlanRoute(Problem):
 # Other search algorithms
 
 
-def recursive_best_first_search(problem, h=None):
-    """[Figure 3.26]"""
+def recursive_best_first_search(problem, h=None, stats=None):
+    """[Figure 3.26]
+    Runs on an explicit stack, one frame per level of the current path, so
+    it is not bounded by the recursion limit. Each frame keeps its
+    successors in a heap on (f, order) instead of re-sorting them after
+    every backed-up f value; a successor that comes back is ordered before
+    its ties, as the stable sort of the textbook version does, so both
+    expand the same nodes. If a stats dict is given, it is filled with
+    node counters. 'Re-expansions' counts expansions of states that were
+    expanded before (the cost RBFS pays for its linear memory) and keeps a
+    set of expanded states to do so; 'Subtree Re-entries' counts returns to
+    an abandoned successor."""
     h = memoize(h or problem.h, 'h')
-
-    def RBFS(problem, node, flimit):
-        if problem.goal_test(node.state):
-            return node, 0  # (The second value is immaterial)
-        successors = node.expand(problem)
-        if len(successors) == 0:
-            return None, np.inf
-        for s in successors:
-            s.f = max(s.path_cost + h(s), node.f)
-        while True:
-            # Order by lowest f value
-            successors.sort(key=lambda x: x.f)
-            best = successors[0]
-            if best.f > flimit:
-                return None, best.f
-            if len(successors) > 1:
-                alternative = successors[1].f
-            else:
-                alternative = np.inf
-            result, best.f = RBFS(problem, best, min(flimit, alternative))
-            if result is not None:
-                return result, best.f
+    # Successors that come back after failing get ever smaller orders
+    reorder = itertools.count(-1, -1)
+    expanded_states = set() if stats is not None else None
+    expanded = reexpanded = reentries = max_depth = stored = peak_stored = 0
 
     node = Node(problem.initial)
     node.f = h(node)
-    result, bestf = RBFS(problem, node, np.inf)
+    stack = []  # (flimit, successor heap) per level
+    child, child_limit = node, np.inf
+    backed_up = None  # f value returned by the frame just left
+    result = None
+    while True:
+        if child is not None:
+            if problem.goal_test(child.state):
+                result = child
+                break
+            successors = child.expand(problem)
+            expanded += 1
+            if expanded_states is not None:
+                if child.state in expanded_states:
+                    reexpanded += 1
+                expanded_states.add(child.state)
+            if successors:
+                for s in successors:
+                    s.f = max(s.path_cost + h(s), child.f)
+                heap = [(s.f, order, s) for order, s in enumerate(successors)]
+                heapq.heapify(heap)
+                stack.append((child_limit, heap))
+                stored += len(heap)
+                max_depth = max(max_depth, len(stack))
+                peak_stored = max(peak_stored, stored)
+            else:
+                backed_up = np.inf
+            child = None
+
+        if not stack:
+            break
+        flimit, heap = stack[-1]
+        if backed_up is not None:
+            best = heap[0][2]
+            best.f = backed_up
+            heapq.heapreplace(heap, (backed_up, next(reorder), best))
+            backed_up = None
+        f, order, best = heap[0]
+        if f > flimit:
+            stack.pop()
+            stored -= len(heap)
+            backed_up = f
+            continue
+        if len(heap) > 2:
+            alternative = min(heap[1][0], heap[2][0])
+        elif len(heap) == 2:
+            alternative = heap[1][0]
+        else:
+            alternative = np.inf
+        if order < 0:
+            reentries += 1
+        child, child_limit = best, min(flimit, alternative)
+
+    if stats is not None:
+        stats.update({
+            'Nodes Expanded': expanded,
+            'Re-expansions': reexpanded,
+            'Subtree Re-entries': reentries,
+            'Max Depth': max_depth,
+            'Peak Nodes Stored': peak_stored,
+        })
     return result
 
 
@@ -1198,6 +1425,14 @@ class GraphProblem(Problem):
     def path_cost(self, cost_so_far, A, action, B):
         return cost_so_far + (self.graph.get(A, B) or np.inf)
 
+    def reverse(self):
+        """Search an undirected graph from goal to initial. Directed graphs
+        need a reverse_problem over the reversed edges."""
+        if self.graph.directed:
+            raise ValueError("A directed GraphProblem cannot be reversed; "
+                             "pass a reverse_problem")
+        return GraphProblem(self.goal, self.initial, self.graph)
+
     def find_min_edge(self):
         """Find minimum value of edges."""
         m = np.inf
@@ -1524,6 +1759,7 @@ class InstrumentedProblem(Problem):
     def __init__(self, problem):
         self.problem = problem
         self.succs = self.goal_tests = self.states = 0
+        self.max_frontier = self.max_explored = 0
         self.found = None
 
     def actions(self, state):
@@ -1547,6 +1783,23 @@ class InstrumentedProblem(Problem):
     def value(self, state):
         return self.problem.value(state)
 
+    def report_frontier(self, frontier_size, explored_size):
+        self.max_frontier = max(self.max_frontier, frontier_size)
+        self.max_explored = max(self.max_explored, explored_size)
+        self.problem.report_frontier(frontier_size, explored_size)
+
+    def reverse(self):
+        """Instrument the reverse of the wrapped problem separately."""
+        return InstrumentedProblem(self.problem.reverse())
+
+    def add_counts(self, other):
+        """Add the counts of another InstrumentedProblem to this one."""
+        self.succs += other.succs
+        self.goal_tests += other.goal_tests
+        self.states += other.states
+        self.max_frontier = max(self.max_frontier, other.max_frontier)
+        self.max_explored = max(self.max_explored, other.max_explored)
+
     def __getattr__(self, attr):
         return getattr(self.problem, attr)
 
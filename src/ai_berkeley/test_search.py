@@ -0,0 +1,252 @@
+import random
+import sys
+import unittest
+
+import numpy as np
+
+from ..puzzle8.packed import PackedEightPuzzle, encode
+from ..puzzle8.sliding import SlidingPuzzle, get_manhattan_distance, random_instance
+from .search import (CUTOFF, EightPuzzle, Graph, GraphProblem, InstrumentedProblem, Node, Problem,
+                     TranspositionTable, astar_search, bidirectional_search, depth_limited_search,
+                     iterative_deepening_search, recursive_best_first_search, romania_map)
+from .utils import memoize
+
+EIGHT_PUZZLE_GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+
+class LineProblem(Problem):
+    """Walk along the integers from 0 to goal, one step forward or back,
+    never past length."""
+
+    def __init__(self, goal, length=None):
+        super().__init__(0, goal)
+        self.length = goal if length is None else length
+
+    def actions(self, state):
+        return [step for step in (1, -1) if 0 <= state + step <= self.length]
+
+    def result(self, state, action):
+        return state + action
+
+
+def scrambled_eight_puzzle(rng, moves):
+    """An 8-puzzle state at most moves slides from the goal."""
+    problem = EightPuzzle(EIGHT_PUZZLE_GOAL)
+    state = EIGHT_PUZZLE_GOAL
+    for _ in range(moves):
+        state = problem.result(state, rng.choice(problem.actions(state)))
+    return state
+
+
+def textbook_rbfs(problem, h):
+    """The recursive RBFS of Figure 3.26 that recursive_best_first_search
+    replaced, as the reference for which nodes it expands."""
+    h = memoize(h, 'h')
+
+    def RBFS(node, flimit):
+        if problem.goal_test(node.state):
+            return node, 0
+        successors = node.expand(problem)
+        if len(successors) == 0:
+            return None, np.inf
+        for s in successors:
+            s.f = max(s.path_cost + h(s), node.f)
+        while True:
+            successors.sort(key=lambda x: x.f)
+            best = successors[0]
+            if best.f > flimit:
+                return None, best.f
+            alternative = successors[1].f if len(successors) > 1 else np.inf
+            result, best.f = RBFS(best, min(flimit, alternative))
+            if result is not None:
+                return result, best.f
+
+    node = Node(problem.initial)
+    node.f = h(node)
+    return RBFS(node, np.inf)[0]
+
+
+class TestBidirectionalSearch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.states = [random_instance(3, rng, EIGHT_PUZZLE_GOAL) for _ in range(10)]
+
+    def optimal_cost(self, state):
+        """Optimal solution length, from A* with the Manhattan distance."""
+        return astar_search(SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL)).path_cost
+
+    def assert_shortest_path(self, problem, cost):
+        node = bidirectional_search(problem)
+        self.assertEqual(node.path_cost, cost)
+        self.assertTrue(problem.goal_test(node.state))
+        path = node.path()
+        self.assertEqual(path[0].state, problem.initial)
+        for parent, child in zip(path, path[1:]):
+            self.assertEqual(problem.result(parent.state, child.action), child.state)
+
+    def test_eight_puzzle_matches_astar(self):
+        """MM finds paths as short as A* on every 8-puzzle representation."""
+        for state in self.states:
+            cost = self.optimal_cost(state)
+            self.assert_shortest_path(EightPuzzle(state), cost)
+            self.assert_shortest_path(SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL), cost)
+            self.assert_shortest_path(PackedEightPuzzle(encode(state), EIGHT_PUZZLE_GOAL), cost)
+
+    def test_instrumented_problem(self):
+        """InstrumentedProblem is searched in both directions and counts both."""
+        for state in self.states:
+            cost = self.optimal_cost(state)
+            for inner in (EightPuzzle(state), SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL)):
+                problem = InstrumentedProblem(inner)
+                self.assertEqual(bidirectional_search(problem).path_cost, cost)
+                forward, backward = InstrumentedProblem(inner), InstrumentedProblem(inner.reverse())
+                bidirectional_search(forward, backward)
+                self.assertGreater(backward.succs, 0)
+                self.assertEqual(problem.succs, forward.succs + backward.succs)
+                self.assertEqual(problem.states, forward.states + backward.states)
+                self.assert_shortest_path(InstrumentedProblem(inner), cost)
+
+    def test_reverse_heuristic_targets_initial_state(self):
+        """The backward heuristic is zero at the backward goal, the initial state."""
+        state = self.states[0]
+        for problem in (EightPuzzle(state), SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL),
+                        PackedEightPuzzle(encode(state), EIGHT_PUZZLE_GOAL),
+                        InstrumentedProblem(SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL))):
+            reverse = problem.reverse()
+            self.assertEqual(reverse.initial, problem.goal)
+            self.assertEqual(reverse.goal, problem.initial)
+            self.assertEqual(reverse.h(Node(problem.initial)), 0)
+
+    def test_custom_heuristic_needs_reverse_problem(self):
+        state = self.states[1]
+        problem = SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL,
+                                heuristic=lambda s: get_manhattan_distance(s, 3, EIGHT_PUZZLE_GOAL))
+        with self.assertRaises(ValueError):
+            bidirectional_search(problem)
+        reverse = SlidingPuzzle(EIGHT_PUZZLE_GOAL, 3, state,
+                                heuristic=lambda s: get_manhattan_distance(s, 3, state))
+        self.assertEqual(bidirectional_search(problem, reverse).path_cost, self.optimal_cost(state))
+
+    def test_irreversible_problems(self):
+        """Only the base Problem raises NotImplementedError; unsupported instances raise ValueError."""
+        directed = Graph({'A': {'B': 1}, 'B': {'C': 1}})
+        with self.assertRaises(ValueError):
+            GraphProblem('A', 'C', directed).reverse()
+        with self.assertRaises(ValueError):
+            bidirectional_search(InstrumentedProblem(GraphProblem('A', 'C', directed)))
+        with self.assertRaises(NotImplementedError):
+            Problem('A', 'C').reverse()
+
+    def test_graph_problem(self):
+        for start, goal in (('Arad', 'Bucharest'), ('Oradea', 'Neamt'), ('Bucharest', 'Bucharest')):
+            problem = GraphProblem(start, goal, romania_map)
+            self.assertEqual(bidirectional_search(problem).path_cost,
+                             astar_search(problem).path_cost)
+            self.assertEqual(bidirectional_search(InstrumentedProblem(problem)).path_cost,
+                             astar_search(problem).path_cost)
+
+
+class TestIterativeDeepeningSearch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        self.states = [scrambled_eight_puzzle(rng, 12) for _ in range(6)]
+
+    def test_optimal_with_and_without_table(self):
+        """IDS finds optimal solutions with no, an unbounded and a bounded table."""
+        for state in self.states:
+            cost = astar_search(EightPuzzle(state)).path_cost
+            for table in (None, TranspositionTable(), TranspositionTable(maxsize=50)):
+                problem = EightPuzzle(state)
+                node = iterative_deepening_search(problem, table)
+                self.assertEqual(node.path_cost, cost)
+                self.assertTrue(problem.goal_test(node.state))
+                if table is not None and table.maxsize is not None:
+                    self.assertLessEqual(len(table.depths), table.maxsize)
+
+    def test_iteration_stats(self):
+        """One dict per depth limit; the table only ever removes work."""
+        state = self.states[0]
+        plain, tabled = [], []
+        node = iterative_deepening_search(EightPuzzle(state), stats=plain)
+        iterative_deepening_search(EightPuzzle(state), TranspositionTable(), tabled)
+        self.assertEqual([it['Depth Limit'] for it in plain], list(range(node.depth + 1)))
+        self.assertEqual(len(tabled), len(plain))
+        for without, with_table in zip(plain, tabled):
+            self.assertEqual(set(without), {'Depth Limit', 'Nodes Expanded', 'Parent Prunes',
+                                            'Transposition Hits'})
+            self.assertEqual(without['Transposition Hits'], 0)
+            self.assertLessEqual(with_table['Nodes Expanded'], without['Nodes Expanded'])
+        self.assertGreater(sum(it['Transposition Hits'] for it in tabled), 0)
+        self.assertGreater(plain[-1]['Parent Prunes'], 0)
+        self.assertEqual(plain[0]['Nodes Expanded'], 0)
+
+    def test_deep_limit_without_recursion(self):
+        depth = 3 * sys.getrecursionlimit()
+        stats = {}
+        node = depth_limited_search(LineProblem(depth), depth, stats=stats)
+        self.assertEqual(node.depth, depth)
+        self.assertEqual(len(node.path()), depth + 1)
+        # Stepping back is always pruned, so the walk expands each state once
+        self.assertEqual(stats['Nodes Expanded'], depth)
+        self.assertEqual(depth_limited_search(LineProblem(depth), depth - 1), CUTOFF)
+        self.assertIsNone(depth_limited_search(LineProblem(depth + 5, length=depth), depth + 10))
+        self.assertIsNone(iterative_deepening_search(LineProblem(20, length=8)))
+
+    def test_bounded_table(self):
+        table = TranspositionTable(maxsize=2)
+        self.assertTrue(table.visit('a', 3))
+        self.assertTrue(table.visit('b', 1))
+        self.assertTrue(table.visit('c', 0))  # Table full: not recorded
+        self.assertTrue(table.visit('c', 0))
+        self.assertFalse(table.visit('a', 4))
+        self.assertTrue(table.visit('a', 2))  # Shallower: updated in place
+        self.assertFalse(table.visit('a', 2))
+        self.assertEqual((len(table.depths), table.hits), (2, 2))
+        table.clear()
+        self.assertEqual((table.depths, table.hits), ({}, 0))
+
+
+class TestRecursiveBestFirstSearch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(2)
+        self.states = [scrambled_eight_puzzle(rng, 16) for _ in range(6)]
+
+    def test_matches_textbook_version(self):
+        """Same solution and the same expansions as the recursive original."""
+        for state in self.states:
+            for inner in (EightPuzzle(state), SlidingPuzzle(state, 3, EIGHT_PUZZLE_GOAL)):
+                reference, problem = InstrumentedProblem(inner), InstrumentedProblem(inner)
+                expected = textbook_rbfs(reference, inner.h)
+                stats = {}
+                node = recursive_best_first_search(problem, inner.h, stats)
+                self.assertEqual([n.state for n in node.path()], [n.state for n in expected.path()])
+                self.assertEqual((problem.succs, problem.states, problem.goal_tests),
+                                 (reference.succs, reference.states, reference.goal_tests))
+                self.assertEqual(node.path_cost, astar_search(inner).path_cost)
+                self.assertEqual(stats['Nodes Expanded'], problem.succs)
+
+    def test_stats(self):
+        stats = {}
+        node = recursive_best_first_search(EightPuzzle(self.states[0]), stats=stats)
+        self.assertEqual(set(stats), {'Nodes Expanded', 'Re-expansions', 'Subtree Re-entries',
+                                      'Max Depth', 'Peak Nodes Stored'})
+        self.assertGreater(stats['Re-expansions'], 0)
+        self.assertLess(stats['Re-expansions'], stats['Nodes Expanded'])
+        self.assertGreater(stats['Subtree Re-entries'], 0)
+        self.assertGreaterEqual(stats['Max Depth'], node.depth)
+        # Linear memory: at most four successors held per level of the path
+        self.assertLessEqual(stats['Peak Nodes Stored'], 4 * stats['Max Depth'])
+        self.assertIsNone(recursive_best_first_search(EightPuzzle(EIGHT_PUZZLE_GOAL), stats={}).parent)
+
+    def test_deep_solution_without_recursion(self):
+        depth = 3 * sys.getrecursionlimit()
+        problem = LineProblem(depth)
+        stats = {}
+        node = recursive_best_first_search(problem, lambda n: depth - n.state, stats)
+        self.assertEqual(node.depth, depth)
+        self.assertEqual(stats['Max Depth'], depth)
+        self.assertEqual(stats['Nodes Expanded'], depth)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import random
+import unittest
+
+from .utils import BucketQueue, PriorityQueue
+
+
+class Item:
+    """Queue item that compares equal by key only, like search Nodes by state."""
+
+    def __init__(self, key, f, g=0):
+        self.key, self.f, self.g = key, f, g
+
+    def __eq__(self, other):
+        return isinstance(other, Item) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return 'Item({}, {}, {})'.format(self.key, self.f, self.g)
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_pop_order(self):
+        """Minimum f first, ties in insertion order; 'max' reverses f."""
+        queue = PriorityQueue('min', lambda x: x.f)
+        queue.extend([Item('a', 3), Item('b', 1), Item('c', 2), Item('d', 1)])
+        self.assertEqual([queue.pop().key for _ in range(4)], ['b', 'd', 'c', 'a'])
+        with self.assertRaises(Exception):
+            queue.pop()
+
+        queue = PriorityQueue('max', lambda x: x.f)
+        queue.extend([Item('a', 3), Item('b', 1), Item('c', 2)])
+        self.assertEqual([queue.pop().key for _ in range(3)], ['a', 'c', 'b'])
+
+        with self.assertRaises(ValueError):
+            PriorityQueue('median')
+
+    def test_duplicate_replaces_entry(self):
+        """Appending an item equal to a queued one replaces it."""
+        queue = PriorityQueue('min', lambda x: x.f)
+        queue.append(Item('a', 5))
+        queue.append(Item('b', 3))
+        replacement = Item('a', 1)
+        queue.append(replacement)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue[Item('a', 0)], 1)
+        self.assertIs(queue.pop(), replacement)
+
+    def test_update(self):
+        queue = PriorityQueue('min', lambda x: x.f)
+        queue.extend([Item('a', 1), Item('b', 2)])
+        queue.update(Item('a', 9))
+        self.assertEqual(queue.pop().key, 'b')
+        with self.assertRaises(KeyError):
+            queue.update(Item('z', 0))
+
+    def test_against_reference_model(self):
+        """Random operation sequences agree with a dict-based model."""
+        rng = random.Random(0)
+        for order in ('min', 'max'):
+            sign = 1 if order == 'min' else -1
+            for _ in range(300):
+                queue = PriorityQueue(order, lambda x: x.f)
+                model = {}  # key -> (signed f, insertion count, item)
+                for count in range(60):
+                    key = rng.randrange(12)
+                    op = rng.random()
+                    if op < 0.4:
+                        item = Item(key, rng.randrange(10))
+                        queue.append(item)
+                        model[key] = (sign * item.f, count, item)
+                    elif op < 0.5:
+                        item = Item(key, rng.randrange(10))
+                        if key in model:
+                            queue.update(item)
+                            model[key] = (sign * item.f, count, item)
+                        else:
+                            with self.assertRaises(KeyError):
+                                queue.update(item)
+                    elif op < 0.7:
+                        if model:
+                            best = min(model.values(), key=lambda e: e[:2])
+                            self.assertIs(queue.pop(), best[2])
+                            del model[best[2].key]
+                        else:
+                            with self.assertRaises(Exception):
+                                queue.pop()
+                    elif op < 0.85:
+                        if key in model:
+                            del queue[Item(key, 0)]
+                            del model[key]
+                        else:
+                            with self.assertRaises(KeyError):
+                                del queue[Item(key, 0)]
+                    else:
+                        probe = Item(key, 0)
+                        self.assertEqual(probe in queue, key in model)
+                        if key in model:
+                            self.assertEqual(queue[probe], model[key][0])
+                        else:
+                            with self.assertRaises(KeyError):
+                                queue[probe]
+                    self.assertEqual(len(queue), len(model))
+
+
+class TestBucketQueue(unittest.TestCase):
+    def test_pop_order(self):
+        """Minimum f first; among equal f, maximum g; among equal (f, g), last in."""
+        queue = BucketQueue(f=lambda x: x.f, g=lambda x: x.g)
+        queue.extend([Item('a', 3, 1), Item('b', 2, 0), Item('c', 2, 2), Item('d', 2, 2)])
+        self.assertEqual([queue.pop().key for _ in range(4)], ['d', 'c', 'b', 'a'])
+        with self.assertRaises(Exception):
+            queue.pop()
+
+    def test_push_below_current_minimum(self):
+        queue = BucketQueue()
+        queue.push('x', 5)
+        queue.push('y', 7)
+        self.assertEqual(queue.pop(), 'x')
+        queue.push('z', 1)
+        self.assertEqual(queue.pop(), 'z')
+        self.assertEqual(queue.pop(), 'y')
+
+    def test_against_reference_model(self):
+        """Random operation sequences agree with a dict-based model."""
+        rng = random.Random(0)
+        for _ in range(300):
+            queue = BucketQueue(f=lambda x: x.f, g=lambda x: x.g)
+            model = {}  # key -> (f, g, insertion count, item)
+            for count in range(60):
+                key = rng.randrange(12)
+                op = rng.random()
+                if op < 0.5:
+                    item = Item(key, rng.randrange(8), rng.randrange(4))
+                    queue.append(item)
+                    model[key] = (item.f, item.g, count, item)
+                elif op < 0.7:
+                    if model:
+                        best = min(model.values(), key=lambda e: (e[0], -e[1], -e[2]))
+                        self.assertIs(queue.pop(), best[3])
+                        del model[best[3].key]
+                    else:
+                        with self.assertRaises(Exception):
+                            queue.pop()
+                elif op < 0.85:
+                    if key in model:
+                        del queue[Item(key, 0)]
+                        del model[key]
+                    else:
+                        with self.assertRaises(KeyError):
+                            del queue[Item(key, 0)]
+                else:
+                    probe = Item(key, 0)
+                    self.assertEqual(probe in queue, key in model)
+                    if key in model:
+                        self.assertEqual(queue[probe], model[key][0])
+                    else:
+                        with self.assertRaises(KeyError):
+                            queue[probe]
+                self.assertEqual(len(queue), len(model))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import bisect
 import collections
 import collections.abc
 import functools
-import heapq
+import itertools
 import operator
 import os.path
 import random
@@ -714,9 +714,9 @@ class hashabledict(dict):
 
 
 # ______________________________________________________________________________
-# Queues: Stack, FIFOQueue, PriorityQueue
+# Queues: Stack, FIFOQueue, PriorityQueue, BucketQueue
 # Stack and FIFOQueue are implemented as list and collection.deque
-# PriorityQueue is implemented here
+# PriorityQueue and BucketQueue are implemented here
 
 
 class PriorityQueue:
@@ -724,10 +724,17 @@ class PriorityQueue:
     order) is returned first.
     If order is 'min', the item with minimum f(x) is
     returned first; if order is 'max', then it is the item with maximum f(x).
-    Also supports dict-like lookup."""
+    Also supports dict-like lookup.
+    Implemented as an indexed binary heap: a position map from each item to
+    its heap slot makes membership O(1) and lookup, deletion and
+    re-prioritising O(log n). Items must be hashable, and the queue holds at
+    most one entry per key: appending an item equal to a queued one replaces
+    it. Ties in f(x) are broken in insertion order."""
 
     def __init__(self, order='min', f=lambda x: x):
-        self.heap = []
+        self.heap = []  # (f(x), insertion count, x); counts are unique, so x is never compared
+        self.index = {}  # x -> position of its entry in heap
+        self.counter = itertools.count()
         if order == 'min':
             self.f = f
         elif order == 'max':  # now item with max f(x)
@@ -737,18 +744,35 @@ class PriorityQueue:
 
     def append(self, item):
         """Insert item at its correct position."""
-        heapq.heappush(self.heap, (self.f(item), item))
+        entry = (self.f(item), next(self.counter), item)
+        position = self.index.get(item)
+        if position is None:
+            self.heap.append(entry)
+            self._sift_up(len(self.heap) - 1)
+        else:
+            self._replace(position, entry)
 
     def extend(self, items):
         """Insert each item in items at its correct position."""
         for item in items:
             self.append(item)
 
+    def update(self, item):
+        """Re-prioritise the queued item equal to item (decrease or increase
+        key), replacing it with item. Raises KeyError if it is not queued."""
+        try:
+            position = self.index[item]
+        except KeyError:
+            raise KeyError(str(item) + " is not in the priority queue")
+        self._replace(position, (self.f(item), next(self.counter), item))
+
     def pop(self):
         """Pop and return the item (with min or max f(x) value)
         depending on the order."""
         if self.heap:
-            return heapq.heappop(self.heap)[1]
+            item = self.heap[0][2]
+            self._remove(0)
+            return item
         else:
             raise Exception('Trying to pop from empty PriorityQueue.')
 
@@ -758,23 +782,159 @@ class PriorityQueue:
 
     def __contains__(self, key):
         """Return True if the key is in PriorityQueue."""
-        return any([item == key for _, item in self.heap])
+        return key in self.index
 
     def __getitem__(self, key):
         """Returns the first value associated with key in PriorityQueue.
         Raises KeyError if key is not present."""
-        for value, item in self.heap:
-            if item == key:
-                return value
-        raise KeyError(str(key) + " is not in the priority queue")
+        try:
+            return self.heap[self.index[key]][0]
+        except KeyError:
+            raise KeyError(str(key) + " is not in the priority queue")
 
     def __delitem__(self, key):
         """Delete the first occurrence of key."""
         try:
-            del self.heap[[item == key for _, item in self.heap].index(True)]
-        except ValueError:
+            position = self.index[key]
+        except KeyError:
+            raise KeyError(str(key) + " is not in the priority queue")
+        self._remove(position)
+
+    def _remove(self, position):
+        """Remove the entry at position, filling the hole with the last entry."""
+        heap = self.heap
+        del self.index[heap[position][2]]
+        last = heap.pop()
+        if position < len(heap):
+            heap[position] = last
+            self.index[last[2]] = position
+            if not self._sift_up(position):
+                self._sift_down(position)
+
+    def _replace(self, position, entry):
+        """Overwrite the entry at position and restore the heap order."""
+        heap = self.heap
+        del self.index[heap[position][2]]
+        heap[position] = entry
+        self.index[entry[2]] = position
+        if not self._sift_up(position):
+            self._sift_down(position)
+
+    def _sift_up(self, position):
+        """Move the entry at position towards the root; return True if it moved."""
+        heap, index = self.heap, self.index
+        entry = heap[position]
+        start = position
+        while position > 0:
+            parent = (position - 1) >> 1
+            if entry > heap[parent]:
+                break
+            heap[position] = heap[parent]
+            index[heap[position][2]] = position
+            position = parent
+        heap[position] = entry
+        index[entry[2]] = position
+        return position != start
+
+    def _sift_down(self, position):
+        """Move the entry at position towards the leaves."""
+        heap, index = self.heap, self.index
+        entry = heap[position]
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry < heap[child]:
+                break
+            heap[position] = heap[child]
+            index[heap[position][2]] = position
+            position = child
+        heap[position] = entry
+        index[entry[2]] = position
+
+
+class BucketQueue:
+    """A min-priority queue for small non-negative integer priorities, such as
+    f = g + h in unit-cost puzzles. Items sit in LIFO buckets indexed by f(x)
+    and, within one f, by g(x); pop returns an item with minimum f and, among
+    those, maximum g (the deepest node). Push and pop take O(1) amortised
+    time, with no comparisons between items.
+    Supports dict-like lookup like PriorityQueue. Holds at most one entry per
+    key: appending an item equal to a queued one replaces it. Deleted and
+    replaced entries are skipped lazily when popped."""
+
+    def __init__(self, f=lambda x: x, g=lambda x: 0):
+        self.f = f
+        self.g = g
+        self.buckets = []  # buckets[f][g]: LIFO list of (f, g, item) entries
+        self.entries = {}  # item -> its live entry
+        self.min_f = 0
+
+    def push(self, item, f, g=0):
+        """Insert item with the given priorities."""
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        row = buckets[f]
+        while len(row) <= g:
+            row.append([])
+        entry = (f, g, item)
+        row[g].append(entry)
+        self.entries[item] = entry
+        if f < self.min_f:
+            self.min_f = f
+
+    def append(self, item):
+        """Insert item at its correct position."""
+        self.push(item, self.f(item), self.g(item))
+
+    def extend(self, items):
+        """Insert each item in items at its correct position."""
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        """Pop and return an item with min f(x), preferring max g(x)."""
+        buckets, entries = self.buckets, self.entries
+        while entries:
+            while not buckets[self.min_f]:
+                self.min_f += 1
+            row = buckets[self.min_f]
+            entry = row[-1].pop()
+            # Keep the deepest non-empty g bucket last
+            while row and not row[-1]:
+                row.pop()
+            item = entry[2]
+            if entries.get(item) is entry:
+                del entries[item]
+                return item
+        raise Exception('Trying to pop from empty BucketQueue.')
+
+    def __len__(self):
+        """Return the number of items in the BucketQueue."""
+        return len(self.entries)
+
+    def __contains__(self, key):
+        """Return True if the key is in BucketQueue."""
+        return key in self.entries
+
+    def __getitem__(self, key):
+        """Returns the f value associated with key in BucketQueue.
+        Raises KeyError if key is not present."""
+        try:
+            return self.entries[key][0]
+        except KeyError:
+            raise KeyError(str(key) + " is not in the priority queue")
+
+    def __delitem__(self, key):
+        """Delete key from BucketQueue."""
+        try:
+            del self.entries[key]
+        except KeyError:
             raise KeyError(str(key) + " is not in the priority queue")
-        heapq.heapify(self.heap)
 
 
 # ______________________________________________________________________________
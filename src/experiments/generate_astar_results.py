@@ -1,34 +1,149 @@
-from ..search.astar_search import PuzzleState, astar_search, generate_solvable_puzzle
-import pandas as pd
+"""
+Batch A* solver for 8-puzzle instances.
+
+Instances are spread over a process pool in chunks and every result row is
+appended to a CSV file as soon as its instance finishes, so long sweeps can
+be watched (and survive being interrupted) while they run. Each instance
+runs under its own expansion and time limits.
+
+Run as a script to solve 100 random instances into data/astar_results.csv,
+or pass a file of instances:
+
+    python -m src.experiments.generate_astar_results instances.txt -o results.csv
+"""
+import argparse
+import csv
+import multiprocessing
+import re
 import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..local_search.budget import Budget
+from ..search.astar_search import PuzzleState, astar_search, generate_solvable_puzzle
+
+__all__ = ['load_instances', 'solve_instance', 'solve_batch']
+
+FIELDS = ['Instance', 'Initial_State', 'Steps', 'Runtime', 'Solved', 'Stop Reason',
+          'Nodes Generated', 'Nodes Expanded', 'Duplicates Suppressed', 'Stale Pops',
+          'Peak Frontier', 'Runtime (ns)']
+
+
+def load_instances(path: Path) -> List[List[int]]:
+    """
+    Read one instance per line: nine tiles separated by commas and/or
+    spaces, optionally in brackets (the Initial_State format of the result
+    files). Blank lines and lines starting with '#' are skipped; for a CSV
+    with a header, the line without nine numbers is skipped too.
+    """
+    instances = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            # Keep only the bracketed board if the line has other columns
+            match = re.search(r'\[([^\]]*)\]', line)
+            tiles = [int(tile) for tile in re.findall(r'\d+', match.group(1) if match else line)]
+            if sorted(tiles) == list(range(9)):
+                instances.append(tiles)
+    return instances
+
 
-# Generate results for 100 random instances
-results = []
-n_instances = 100
-
-for i in range(n_instances):
-    # Generate a solvable puzzle
-    puzzle = generate_solvable_puzzle()
-    state = PuzzleState(puzzle)
-    
-    # Get A* solution
-    start_time = time.time()
-    solution = astar_search(state)
-    end_time = time.time()
-    
-    result = {
-        'Instance': i,
-        'Initial_State': str(puzzle),
+def solve_instance(task: Tuple[int, Sequence[int], Optional[Budget], str]) -> Dict[str, Any]:
+    """Solve one (index, puzzle, budget, queue) task and return its result row."""
+    index, puzzle, budget, queue = task
+    stats: Dict[str, Any] = {}
+    start_time = time.perf_counter_ns()
+    solution = astar_search(PuzzleState(list(puzzle)), stats=stats, queue=queue, budget=budget)
+    elapsed = time.perf_counter_ns() - start_time
+    return {
+        'Instance': index,
+        'Initial_State': str(list(puzzle)),
         'Steps': len(solution.path()) if solution else 0,
-        'Runtime': end_time - start_time,
-        'Solved': solution is not None
+        'Runtime': elapsed / 1e9,
+        'Solved': solution is not None,
+        **stats,
+        'Runtime (ns)': elapsed,
     }
-    results.append(result)
-    print(f"Instance {i}: {'Solved' if solution else 'Unsolved'} in {result['Steps']} steps")
-
-# Convert to DataFrame and save
-df = pd.DataFrame(results)
-df.to_csv('data/astar_results.csv', index=False)
-print(f"\nGenerated A* results for {n_instances} instances")
-print(f"Average steps for solved instances: {df[df['Solved']]['Steps'].mean():.1f}")
-print(f"Average runtime: {df['Runtime'].mean():.3f} seconds") 
\ No newline at end of file
+
+
+def solve_batch(
+    instances: Iterable[Sequence[int]],
+    output: Path,
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+    max_expansions: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    queue: str = 'heap'
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solve ``instances`` with A* on a pool of ``max_workers`` processes (all
+    cores by default), handing them out ``chunksize`` at a time.
+
+    Rows are written to the CSV file ``output`` in completion order, each
+    flushed as soon as it arrives, and also yielded to the caller.
+    ``max_expansions`` and ``time_limit`` (seconds) apply to each instance
+    separately; an instance that hits one is recorded as unsolved with the
+    limit as its 'Stop Reason'.
+    """
+    budget = None
+    if max_expansions is not None or time_limit is not None:
+        budget = Budget(max_iterations=max_expansions, time_limit=time_limit)
+    tasks = ((index, list(puzzle), budget, queue) for index, puzzle in enumerate(instances))
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    context = multiprocessing.get_context()
+    with open(output, 'w', newline='') as f, context.Pool(max_workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in pool.imap_unordered(solve_instance, tasks, chunksize=chunksize):
+            writer.writerow(row)
+            f.flush()
+            yield row
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('instances', nargs='?', type=Path,
+                        help='file with one instance per line (default: random instances)')
+    parser.add_argument('-n', '--num-instances', type=int, default=100,
+                        help='number of random instances when no file is given')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the random instances')
+    parser.add_argument('-o', '--output', type=Path, default=Path('data/astar_results.csv'))
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    parser.add_argument('--chunksize', type=int, default=16)
+    parser.add_argument('--max-expansions', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=None, help='seconds per instance')
+    parser.add_argument('--queue', choices=['heap', 'bucket'], default='heap')
+    args = parser.parse_args(argv)
+
+    if args.instances is not None:
+        instances = load_instances(args.instances)
+    else:
+        np.random.seed(args.seed)
+        instances = [generate_solvable_puzzle() for _ in range(args.num_instances)]
+
+    solved = 0
+    steps = 0
+    runtime_ns = 0
+    for count, row in enumerate(solve_batch(instances, args.output, args.workers, args.chunksize,
+                                            args.max_expansions, args.time_limit, args.queue), 1):
+        solved += row['Solved']
+        steps += row['Steps']
+        runtime_ns += row['Runtime (ns)']
+        if count % max(1, len(instances) // 20) == 0:
+            print(f"{count}/{len(instances)} instances done, {solved} solved")
+
+    print(f"\nGenerated A* results for {len(instances)} instances in {args.output}")
+    if solved:
+        print(f"Average steps for solved instances: {steps / solved:.1f}")
+    if instances:
+        print(f"Average runtime: {runtime_ns / len(instances) / 1e9:.3f} seconds")
+
+
+if __name__ == '__main__':
+    main()
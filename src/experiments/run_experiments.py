@@ -40,15 +40,18 @@ def generate_puzzle_results():
     )
     from src.puzzle8.generator import (
         generate_8puzzle_instance,
-        get_manhattan_distance,
-        get_valid_moves,
-        apply_move
+        get_manhattan_distance
     )
+    from src.puzzle8.board import PuzzleMoves
+    from src.puzzle8.oracle import DistanceOracle
+    from src.local_search.cache import EvaluationCache
     import pandas as pd
     import time
     
     results = []
     num_instances = 50
+    # Exact solution lengths, used as ground truth for every instance
+    oracle = DistanceOracle()
     print(f"\nRunning 8-puzzle experiments with {num_instances} instances...")
     
     for i in range(num_instances):
@@ -56,37 +59,44 @@ def generate_puzzle_results():
             # Generate a random puzzle
             initial_state = generate_8puzzle_instance()
             
-            # Define evaluation function (negative Manhattan distance as we want to maximize)
-            evaluate = lambda state: -get_manhattan_distance(state)
+            # Define evaluation function (negative Manhattan distance as we want to maximize).
+            # The move problem scores every slide by its delta, so evaluate only
+            # sees start, restart and final states; the cache shares those
+            # between the algorithms run on this instance.
+            evaluate = EvaluationCache(lambda state: -get_manhattan_distance(state))
+            
+            # Move-based neighbourhood: the algorithms slide tiles in place
+            # instead of building every neighbour tuple.
+            neighbors = PuzzleMoves()
             
             # Run each algorithm and collect metrics
             algorithms = {
                 'Hill Climbing (Steepest)': lambda: hill_climbing_steepest(
                     initial_state,
-                    lambda s: [apply_move(s, m) for m in get_valid_moves(s.index(0))],
+                    neighbors,
                     evaluate
                 ),
                 'Hill Climbing (First Choice)': lambda: hill_climbing_first_choice(
                     initial_state,
-                    lambda s: [apply_move(s, m) for m in get_valid_moves(s.index(0))],
+                    neighbors,
                     evaluate
                 ),
                 'Hill Climbing (Random Restart)': lambda: hill_climbing_random_restart(
                     initial_state,
-                    lambda s: [apply_move(s, m) for m in get_valid_moves(s.index(0))],
+                    neighbors,
                     evaluate,
                     generate_8puzzle_instance,
                     max_restarts=10
                 ),
                 'Simulated Annealing (Exponential)': lambda: simulated_annealing(
                     initial_state,
-                    lambda s: [apply_move(s, m) for m in get_valid_moves(s.index(0))],
+                    neighbors,
                     evaluate,
                     exponential_schedule(k=30, lam=0.001)
                 ),
                 'Simulated Annealing (Linear)': lambda: simulated_annealing(
                     initial_state,
-                    lambda s: [apply_move(s, m) for m in get_valid_moves(s.index(0))],
+                    neighbors,
                     evaluate,
                     linear_schedule
                 )
@@ -97,22 +107,26 @@ def generate_puzzle_results():
             for algo_name, algo_func in algorithms.items():
                 print(f"  Running {algo_name}...", end='')
                 try:
+                    cache_before = evaluate.stats()
                     start_time = time.time()
                     final_state, value_history = algo_func()
                     runtime = time.time() - start_time
+                    cache_stats = {key: count - cache_before[key]
+                                   for key, count in evaluate.stats().items()}
                     
                     # Calculate additional metrics
                     initial_value = evaluate(initial_state)
                     final_value = evaluate(final_state)
                     improvement = initial_value - final_value
                     solution_found = get_manhattan_distance(final_state) == 0
-                    steps = len(value_history) - 1
+                    steps = value_history.count - 1
                     
                     results.append({
                         'Problem': '8-Puzzle',
                         'Instance': i,
                         'Algorithm': algo_name,
                         'Initial State': initial_state,
+                        'Optimal Distance': oracle.distance(initial_state),
                         'Final State': final_state,
                         'Initial Value': initial_value,
                         'Final Value': final_value,
@@ -120,7 +134,9 @@ def generate_puzzle_results():
                         'Solution Found': solution_found,
                         'Steps': steps,
                         'Runtime': runtime,
-                        'Value History': value_history
+                        'Stop Reason': value_history.stop_reason,
+                        'Value History': value_history,
+                        **cache_stats
                     })
                     print(f" done. {'Solution found!' if solution_found else 'No solution.'} Steps: {steps}")
                 except Exception as e:
@@ -153,9 +169,10 @@ def generate_queens_results():
     )
     from src.queens8.generator import (
         generate_8queens_state,
-        count_conflicts,
-        get_neighbors
+        count_conflicts
     )
+    from src.queens8.board import IncrementalConflictCounter, QueensMoves
+    from src.local_search.cache import EvaluationCache
     import pandas as pd
     import time
     
@@ -168,37 +185,45 @@ def generate_queens_results():
             # Generate a random queens configuration
             initial_state = generate_8queens_state()
             
-            # Define evaluation function (negative conflicts as we want to maximize)
-            evaluate = lambda state: -count_conflicts(state)
+            # Define evaluation function (negative conflicts as we want to maximize).
+            # The move problem scores every queen move by its delta, so evaluate
+            # only sees start, restart and final states; the cache shares those
+            # between the algorithms run on this instance.
+            conflicts = IncrementalConflictCounter()
+            evaluate = EvaluationCache(lambda state: -conflicts(state))
+            
+            # Move-based neighbourhood: queens are moved in place and scored
+            # by their O(1) conflict delta.
+            neighbors = QueensMoves()
             
             # Run each algorithm and collect metrics
             algorithms = {
                 'Hill Climbing (Steepest)': lambda: hill_climbing_steepest(
                     initial_state,
-                    get_neighbors,
+                    neighbors,
                     evaluate
                 ),
                 'Hill Climbing (First Choice)': lambda: hill_climbing_first_choice(
                     initial_state,
-                    get_neighbors,
+                    neighbors,
                     evaluate
                 ),
                 'Hill Climbing (Random Restart)': lambda: hill_climbing_random_restart(
                     initial_state,
-                    get_neighbors,
+                    neighbors,
                     evaluate,
                     generate_8queens_state,
                     max_restarts=10
                 ),
                 'Simulated Annealing (Exponential)': lambda: simulated_annealing(
                     initial_state,
-                    get_neighbors,
+                    neighbors,
                     evaluate,
                     exponential_schedule(k=30, lam=0.001)
                 ),
                 'Simulated Annealing (Linear)': lambda: simulated_annealing(
                     initial_state,
-                    get_neighbors,
+                    neighbors,
                     evaluate,
                     linear_schedule
                 )
@@ -209,16 +234,19 @@ def generate_queens_results():
             for algo_name, algo_func in algorithms.items():
                 print(f"  Running {algo_name}...", end='')
                 try:
+                    cache_before = evaluate.stats()
                     start_time = time.time()
                     final_state, value_history = algo_func()
                     runtime = time.time() - start_time
+                    cache_stats = {key: count - cache_before[key]
+                                   for key, count in evaluate.stats().items()}
                     
                     # Calculate additional metrics
                     initial_value = evaluate(initial_state)
                     final_value = evaluate(final_state)
                     improvement = initial_value - final_value
                     solution_found = count_conflicts(final_state) == 0
-                    steps = len(value_history) - 1
+                    steps = value_history.count - 1
                     
                     results.append({
                         'Problem': '8-Queens',
@@ -232,7 +260,9 @@ def generate_queens_results():
                         'Solution Found': solution_found,
                         'Steps': steps,
                         'Runtime': runtime,
-                        'Value History': value_history
+                        'Stop Reason': value_history.stop_reason,
+                        'Value History': value_history,
+                        **cache_stats
                     })
                     print(f" done. {'Solution found!' if solution_found else 'No solution.'} Steps: {steps}")
                 except Exception as e:
@@ -250,6 +280,54 @@ def generate_queens_results():
     
     return results_df
 
+def generate_large_queens_results():
+    """Generate results for large N-Queens with the min-conflicts solver."""
+    data_dir, figures_dir = setup_environment()
+    
+    # Import necessary functions
+    from src.queens8.min_conflicts import min_conflicts_queens
+    import pandas as pd
+    import random
+    import time
+    
+    results = []
+    board_sizes = [10**3, 10**4, 10**5, 10**6]
+    num_instances = 5
+    print(f"\nRunning large N-queens experiments with {num_instances} instances per size...")
+    
+    for n in board_sizes:
+        for i in range(num_instances):
+            print(f"  N={n} instance {i+1}/{num_instances}...", end='')
+            try:
+                start_time = time.time()
+                board, stats = min_conflicts_queens(n, rng=random.Random(i))
+                runtime = time.time() - start_time
+                
+                results.append({
+                    'Problem': f'{n}-Queens',
+                    'Instance': i,
+                    'Algorithm': 'Min-Conflicts',
+                    'Board Size': n,
+                    'Initial Value': -stats['Initial Conflicts'],
+                    'Final Value': -stats['Final Conflicts'],
+                    'Value Improvement': stats['Final Conflicts'] - stats['Initial Conflicts'],
+                    'Solution Found': stats['Solution Found'],
+                    'Steps': stats['Steps'],
+                    'Runtime': runtime,
+                    'Bytes Per Queen': board.memory_bytes() / n
+                })
+                print(f" done. {'Solution found!' if stats['Solution Found'] else 'No solution.'} Steps: {stats['Steps']}")
+            except Exception as e:
+                print(f" error: {str(e)}")
+                continue
+    
+    # Save results
+    results_df = pd.DataFrame(results)
+    results_df.to_csv(data_dir / 'large_queens_results.csv', index=False)
+    print(f"Saved {len(results)} results to data/large_queens_results.csv")
+    
+    return results_df
+
 def calculate_summary_statistics(df):
     """Calculate summary statistics for plotting.
     
@@ -337,9 +415,10 @@ def main():
     1. Creates necessary directories (data/ and figures/)
     2. Runs 8-puzzle experiments and saves results
     3. Runs 8-queens experiments and saves results
-    4. Combines results into a single DataFrame
-    5. Generates summary statistics
-    6. Creates visualizations including:
+    4. Runs large N-queens (min-conflicts) experiments and saves results
+    5. Combines the 8-puzzle and 8-queens results into a single DataFrame
+    6. Generates summary statistics
+    7. Creates visualizations including:
        - Success rate plots for each problem
        - Steps plots for each problem
        - Runtime plots for each problem
@@ -361,6 +440,11 @@ def main():
     queens_results.to_csv('data/queens_results.csv', index=False)
     print(f"Saved {len(queens_results)} results to data/queens_results.csv")
 
+    print("\nRunning large N-queens experiments...")
+    large_queens_results = generate_large_queens_results()
+    large_queens_results.to_csv('data/large_queens_results.csv', index=False)
+    print(f"Saved {len(large_queens_results)} results to data/large_queens_results.csv")
+
     print("\nCombining results...")
     # Combine results
     all_results = pd.concat([puzzle_results, queens_results])
@@ -1,20 +1,35 @@
 import random
 import math
-from typing import List, Tuple, Callable, Any
+from itertools import count
+from typing import List, Tuple, Callable, Any, Optional, Union
+
+from .budget import Budget, BudgetTracker, start_budget
+from .history import ValueHistory, new_history
+from .moves import annealing_moves, first_choice_moves, is_move_problem, steepest_moves
 
 def hill_climbing_steepest(
     initial_state: List[int],
     get_neighbors: Callable[[List[int]], List[List[int]]],
-    evaluate: Callable[[List[int]], float]
-) -> Tuple[List[int], List[float]]:
+    evaluate: Callable[[List[int]], float],
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[List[int], ValueHistory]:
     """
     Steepest-ascent hill climbing implementation.
+    record selects what the returned value history keeps (see history.py);
+    budget bounds the run (see budget.py).
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    if is_move_problem(get_neighbors):
+        return steepest_moves(initial_state, get_neighbors, evaluate, record, tracker)
+
     current_state = initial_state
     current_value = evaluate(current_state)
-    value_history = [current_value]
+    value_history = new_history(record)
+    value_history.append(current_value)
     
-    while True:
+    while tracker.next_iteration():
         neighbors = get_neighbors(current_state)
         if not neighbors:
             break
@@ -30,21 +45,32 @@ def hill_climbing_steepest(
         current_value = best_value
         value_history.append(current_value)
     
+    value_history.stop_reason = tracker.stop_reason or 'local_optimum'
     return current_state, value_history
 
 def hill_climbing_first_choice(
     initial_state: List[int],
     get_neighbors: Callable[[List[int]], List[List[int]]],
-    evaluate: Callable[[List[int]], float]
-) -> Tuple[List[int], List[float]]:
+    evaluate: Callable[[List[int]], float],
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[List[int], ValueHistory]:
     """
     First-choice hill climbing implementation.
+    record selects what the returned value history keeps (see history.py);
+    budget bounds the run (see budget.py).
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    if is_move_problem(get_neighbors):
+        return first_choice_moves(initial_state, get_neighbors, evaluate, record, tracker)
+
     current_state = initial_state
     current_value = evaluate(current_state)
-    value_history = [current_value]
+    value_history = new_history(record)
+    value_history.append(current_value)
     
-    while True:
+    while tracker.next_iteration():
         neighbors = get_neighbors(current_state)
         if not neighbors:
             break
@@ -66,6 +92,7 @@ def hill_climbing_first_choice(
         if not improved:
             break
     
+    value_history.stop_reason = tracker.stop_reason or 'local_optimum'
     return current_state, value_history
 
 def hill_climbing_random_restart(
@@ -73,68 +100,107 @@ def hill_climbing_random_restart(
     get_neighbors: Callable[[List[int]], List[List[int]]],
     evaluate: Callable[[List[int]], float],
     generate_random_state: Callable[[], List[int]],
-    max_restarts: int = 10
-) -> Tuple[List[int], List[float]]:
+    max_restarts: int = 10,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[List[int], ValueHistory]:
     """
     Random restart hill climbing implementation.
+    All restarts record into one value history, selected by record, and
+    draw on one budget.
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    moves = is_move_problem(get_neighbors)
     best_state = initial_state
     best_value = evaluate(initial_state)
-    all_value_history = []
+    all_value_history = new_history(record)
     
     for _ in range(max_restarts):
         current_state = generate_random_state()
-        current_value = evaluate(current_state)
-        value_history = [current_value]
+        if moves:
+            current_state, _ = steepest_moves(current_state, get_neighbors, evaluate,
+                                              all_value_history, tracker)
+            current_value = all_value_history.last
+        else:
+            current_value = evaluate(current_state)
+            all_value_history.append(current_value)
         
-        while True:
-            neighbors = get_neighbors(current_state)
-            if not neighbors:
-                break
+            while tracker.next_iteration():
+                neighbors = get_neighbors(current_state)
+                if not neighbors:
+                    break
                 
-            # Find the best neighbor
-            best_neighbor = max(neighbors, key=evaluate)
-            best_neighbor_value = evaluate(best_neighbor)
+                # Find the best neighbor
+                best_neighbor = max(neighbors, key=evaluate)
+                best_neighbor_value = evaluate(best_neighbor)
             
-            if best_neighbor_value <= current_value:
-                break
+                if best_neighbor_value <= current_value:
+                    break
                 
-            current_state = best_neighbor
-            current_value = best_neighbor_value
-            value_history.append(current_value)
-        
-        all_value_history.extend(value_history)
+                current_state = best_neighbor
+                current_value = best_neighbor_value
+                all_value_history.append(current_value)
         
         if current_value > best_value:
             best_state = current_state
             best_value = current_value
+        if tracker.stop_reason:
+            break
     
+    all_value_history.stop_reason = tracker.stop_reason or 'restarts'
     return best_state, all_value_history
 
 def simulated_annealing(
     initial_state: List[int],
     get_neighbors: Callable[[List[int]], List[List[int]]],
     evaluate: Callable[[List[int]], float],
-    schedule: Callable[[int], float]
-) -> Tuple[List[int], List[float]]:
+    schedule: Callable[[int], float],
+    random_neighbor: Optional[Callable[[List[int], Any], List[int]]] = None,
+    record: Union[str, ValueHistory] = 'all',
+    budget: Union[None, Budget, BudgetTracker] = None
+) -> Tuple[List[int], ValueHistory]:
     """
     Simulated annealing implementation.
+    If random_neighbor(state, rng) is given, it draws the candidate directly
+    instead of choosing from the full get_neighbors list.
+    record selects what the returned value history keeps (see history.py).
+    Unless the budget sets a limit, the run is capped at 999 iterations;
+    with one, it runs until the schedule or the budget runs out, and
+    returns the best state seen if the budget did.
     """
+    tracker = start_budget(budget)
+    evaluate = tracker.counted(evaluate)
+    # Schedules such as linear_schedule never reach zero on their own
+    capped = not tracker.has_limits
+    if is_move_problem(get_neighbors):
+        return annealing_moves(initial_state, get_neighbors, evaluate, schedule, record,
+                               tracker, range(1, 1000) if capped else count(1))
+
     current_state = initial_state
     current_value = evaluate(current_state)
-    value_history = [current_value]
+    best_state = current_state
+    best_value = current_value
+    value_history = new_history(record)
+    value_history.append(current_value)
     
-    for t in range(1, 1000):  # Max 1000 iterations
+    for t in (range(1, 1000) if capped else count(1)):
+        if not tracker.next_iteration():
+            break
         temperature = schedule(t)
         if temperature <= 0:
             break
             
-        neighbors = get_neighbors(current_state)
-        if not neighbors:
-            break
-            
         # Randomly select a neighbor
-        next_state = random.choice(neighbors)
+        if random_neighbor is not None:
+            next_state = random_neighbor(current_state, random)
+            if next_state is None:
+                break
+        else:
+            neighbors = get_neighbors(current_state)
+            if not neighbors:
+                break
+            next_state = random.choice(neighbors)
         next_value = evaluate(next_state)
         
         # Calculate delta E (negative because we're maximizing)
@@ -145,7 +211,14 @@ def simulated_annealing(
             current_state = next_state
             current_value = next_value
             value_history.append(current_value)
+            if current_value > best_value:
+                best_state = current_state
+                best_value = current_value
     
+    if tracker.stop_reason:
+        value_history.stop_reason = tracker.stop_reason
+        return best_state, value_history
+    value_history.stop_reason = 'schedule'
     return current_state, value_history
 
 def exponential_schedule(k: float = 20, lam: float = 0.005) -> Callable[[int], float]:
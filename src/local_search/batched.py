@@ -0,0 +1,91 @@
+"""
+Lock-step simulated annealing over many independent chains.
+
+Instead of running ``simulated_annealing`` once per chain, all K chains are
+held in NumPy arrays and advanced together: one vectorized draw of K
+proposals, one vectorized delta evaluation and one vectorized Metropolis
+test per temperature step.
+"""
+from typing import Any, Callable, List, Optional, Protocol, Tuple
+
+import numpy as np
+
+
+class BatchProblem(Protocol):
+    """
+    Protocol for a batch of K chains of one problem, held as arrays.
+
+    Values follow the same maximize convention as the scalar algorithms
+    (e.g. ``-count_conflicts``), and ``delta`` must agree with ``values``.
+    """
+
+    states: np.ndarray  # (K, n): one state per row
+
+    def values(self) -> np.ndarray:
+        """Return the (K,) current values."""
+        ...
+
+    def propose(self, rng: np.random.Generator) -> Any:
+        """Draw one uniform random move per chain."""
+        ...
+
+    def delta(self, proposal: Any) -> np.ndarray:
+        """Return the (K,) value changes the proposed moves would cause."""
+        ...
+
+    def apply(self, proposal: Any, accepted: np.ndarray) -> None:
+        """Apply the proposed moves of the chains flagged in ``accepted``."""
+        ...
+
+
+def batched_simulated_annealing(
+    problem: BatchProblem,
+    schedule: Callable[[int], float],
+    max_iterations: int = 1000,
+    rng: Optional[np.random.Generator] = None
+) -> List[Tuple[Tuple[int, ...], List[float]]]:
+    """
+    Simulated annealing on every chain of ``problem`` in lock-step.
+
+    Follows ``local_search.algorithms.simulated_annealing`` step for step
+    (time starts at 1, the run stops when the temperature drops to 0 or
+    after ``max_iterations - 1`` steps) and returns, per chain, the same
+    ``(final_state, value_history)`` pair, where the history holds the
+    initial value followed by the value after each accepted move.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    initial_values = problem.values()
+    num_chains = len(initial_values)
+    steps = []
+    accepted_steps = []
+
+    for t in range(1, max_iterations):
+        temperature = schedule(t)
+        if temperature <= 0:
+            break
+
+        proposal = problem.propose(rng)
+        delta_e = problem.delta(proposal)
+        # Clamp at 0 so improving moves cannot overflow exp; they are
+        # accepted by the first test anyway
+        accepted = (delta_e > 0) | (rng.random(num_chains) < np.exp(np.minimum(delta_e, 0) / temperature))
+        problem.apply(proposal, accepted)
+
+        steps.append(problem.values())
+        accepted_steps.append(accepted)
+
+    if steps:
+        values = np.stack(steps, axis=1)            # (K, steps)
+        accepted = np.stack(accepted_steps, axis=1)  # (K, steps)
+    else:
+        values = np.empty((num_chains, 0), dtype=initial_values.dtype)
+        accepted = np.empty((num_chains, 0), dtype=bool)
+
+    results = []
+    for k in range(num_chains):
+        history = [initial_values[k].item()]
+        history.extend(values[k, accepted[k]].tolist())
+        results.append((tuple(problem.states[k].tolist()), history))
+    return results
@@ -0,0 +1,125 @@
+"""
+Search budgets for anytime runs of the local search algorithms.
+
+A ``Budget`` caps the number of iterations, the number of evaluations and
+the wall-clock time of a run. Every algorithm accepts one as ``budget``;
+the limits are checked between iterations, and a run that hits one stops
+with the best state found so far. Why a run stopped is recorded as
+``stop_reason`` on the value history it returns: one of the budget reasons
+below, or the algorithm's natural end (``'local_optimum'``, ``'schedule'``
+or ``'restarts'``).
+
+Evaluations are calls to ``evaluate`` plus, for move problems, calls to
+``problem.delta``.
+"""
+import time
+from typing import Any, Callable, Optional, Union
+
+MAX_ITERATIONS = 'max_iterations'
+MAX_EVALUATIONS = 'max_evaluations'
+DEADLINE = 'deadline'
+
+
+class Budget:
+    """
+    Limits for one run; None means unlimited. ``time_limit`` is in seconds.
+    A budget is only a description and can be reused: each run draws a
+    fresh ``BudgetTracker`` from it, so several algorithms can be compared
+    under the same budget.
+    """
+
+    def __init__(
+        self,
+        max_iterations: Optional[int] = None,
+        max_evaluations: Optional[int] = None,
+        time_limit: Optional[float] = None
+    ):
+        for name, limit in (('max_iterations', max_iterations),
+                            ('max_evaluations', max_evaluations),
+                            ('time_limit', time_limit)):
+            if limit is not None and limit < 0:
+                raise ValueError(f"{name} must be non-negative or None, got {limit}")
+        self.max_iterations = max_iterations
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+
+    def start(self) -> 'BudgetTracker':
+        """Start the clock for one run."""
+        return BudgetTracker(self)
+
+
+class BudgetTracker:
+    """
+    Spending of one ``Budget`` during a run.
+
+    Algorithms call ``next_iteration`` at the top of every iteration and
+    route evaluations through ``counted``. The wall clock is read with
+    ``perf_counter_ns`` only when the budget has a time limit.
+    """
+
+    def __init__(self, budget: Budget):
+        self.budget = budget
+        self.iterations = 0
+        self.evaluations = 0
+        self.stop_reason: Optional[str] = None
+        self.deadline_ns: Optional[int] = None
+        if budget.time_limit is not None:
+            self.deadline_ns = time.perf_counter_ns() + int(budget.time_limit * 1e9)
+
+    def next_iteration(self) -> bool:
+        """
+        Count one iteration and return True, or return False and set
+        ``stop_reason`` if the budget is spent.
+        """
+        if self.stop_reason is not None:
+            return False
+        budget = self.budget
+        if budget.max_iterations is not None and self.iterations >= budget.max_iterations:
+            self.stop_reason = MAX_ITERATIONS
+        elif budget.max_evaluations is not None and self.evaluations >= budget.max_evaluations:
+            self.stop_reason = MAX_EVALUATIONS
+        elif self.deadline_ns is not None and time.perf_counter_ns() >= self.deadline_ns:
+            self.stop_reason = DEADLINE
+        else:
+            self.iterations += 1
+            return True
+        return False
+
+    def counted(self, evaluate: Callable[[Any], float]) -> Callable[[Any], float]:
+        """Return ``evaluate`` wrapped so that every call is counted."""
+        if isinstance(evaluate, _CountedEvaluate) and evaluate.tracker is self:
+            return evaluate
+        return _CountedEvaluate(evaluate, self)
+
+    @property
+    def limits_evaluations(self) -> bool:
+        return self.budget.max_evaluations is not None
+
+    @property
+    def has_limits(self) -> bool:
+        budget = self.budget
+        return (budget.max_iterations is not None or budget.max_evaluations is not None
+                or budget.time_limit is not None)
+
+
+class _CountedEvaluate:
+    """Evaluation function that charges each call to a tracker."""
+
+    def __init__(self, evaluate: Callable[[Any], float], tracker: BudgetTracker):
+        self.evaluate = evaluate
+        self.tracker = tracker
+
+    def __call__(self, state: Any) -> float:
+        self.tracker.evaluations += 1
+        return self.evaluate(state)
+
+
+def start_budget(budget: Union[None, Budget, BudgetTracker] = None) -> BudgetTracker:
+    """
+    Return the tracker an algorithm should charge: ``budget`` itself if it
+    is already running (so random restarts share one budget), otherwise a
+    fresh tracker for ``budget``, unlimited if None.
+    """
+    if isinstance(budget, BudgetTracker):
+        return budget
+    return (budget or Budget()).start()
@@ -0,0 +1,63 @@
+"""
+Bounded evaluation cache shared by the local search algorithms.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class EvaluationCache:
+    """
+    Memoizing wrapper around an ``evaluate`` function with LRU eviction.
+
+    The cache is callable like the function it wraps, so it can be passed to
+    any algorithm as ``evaluate``. Share one instance across all algorithms
+    run on the same problem instance to reuse evaluations between them.
+    States must be hashable (the package uses tuples). ``maxsize`` of None
+    keeps every entry; 0 disables caching but still counts misses.
+    """
+
+    def __init__(self, evaluate: Callable[[Hashable], float], maxsize: int = 100_000):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative or None, got {maxsize}")
+        self.evaluate = evaluate
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, float]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, state: Hashable) -> float:
+        entries = self._entries
+        try:
+            value = entries[state]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(state)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self.evaluate(state)
+        if self.maxsize != 0:
+            entries[state] = value
+            if self.maxsize is not None and len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit, miss and eviction counters."""
+        return {
+            'Cache Hits': self.hits,
+            'Cache Misses': self.misses,
+            'Cache Evictions': self.evictions
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,143 @@
+"""
+Recording modes for the value histories returned by the local search
+algorithms.
+
+Every algorithm appends the value of each accepted state to a
+``ValueHistory``. The recording mode decides which of those values are kept:
+
+- ``'all'``: every value (the default, same as the old plain lists)
+- ``'none'``: nothing; only the counters below are maintained
+- ``'final-only'``: just the most recent value
+- ``'improvements-only'``: values that beat every earlier one
+- ``'every-<k>'``: every k-th value, starting with the first
+- ``'ring-<n>'``: the n most recent values
+
+Whatever the mode, ``count`` is the number of values offered, so the number
+of steps taken is always ``history.count - 1``. ``first``, ``last`` and
+``best`` are tracked as well, and the algorithms set ``stop_reason`` to say
+why the run ended (see budget.py).
+"""
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+MODES = ('all', 'none', 'final-only', 'improvements-only', 'every-k', 'ring')
+
+
+class ValueHistory:
+    """
+    Compact, mode-filtered history of accepted values.
+
+    Values are stored as C doubles in an ``array('d')``, or in a fixed-size
+    NumPy buffer for the ring mode. Behaves like a read-only sequence of
+    the kept values (``len``, indexing, iteration) with ``append`` and
+    ``extend`` for recording.
+    """
+
+    def __init__(self, mode: str = 'all', k: int = 1, capacity: int = 1000):
+        if mode not in MODES:
+            raise ValueError(f"Unknown recording mode {mode!r}; expected one of {MODES}")
+        if mode == 'every-k' and k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        if mode == 'ring' and capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.mode = mode
+        self.k = k
+        self.capacity = capacity
+        self.count = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.best: Optional[float] = None
+        self.stop_reason: Optional[str] = None
+        if mode == 'ring':
+            self._ring = np.empty(capacity, dtype=np.float64)
+        else:
+            self._values = array('d')
+
+    @classmethod
+    def from_mode(cls, record: str) -> 'ValueHistory':
+        """
+        Build a history from a mode string, where ``'every-<k>'`` and
+        ``'ring-<n>'`` carry their parameter, e.g. ``'every-10'``.
+        """
+        for prefix, mode, keyword in (('every-', 'every-k', 'k'), ('ring-', 'ring', 'capacity')):
+            if record.startswith(prefix) and record != 'every-k':
+                try:
+                    size = int(record[len(prefix):])
+                except ValueError:
+                    raise ValueError(f"Invalid recording mode {record!r}") from None
+                return cls(mode, **{keyword: size})
+        return cls(record)
+
+    def append(self, value: float) -> None:
+        index = self.count
+        self.count += 1
+        improved = self.best is None or value > self.best
+        if index == 0:
+            self.first = value
+        self.last = value
+        if improved:
+            self.best = value
+
+        mode = self.mode
+        if mode == 'all':
+            self._values.append(value)
+        elif mode == 'improvements-only':
+            if improved:
+                self._values.append(value)
+        elif mode == 'every-k':
+            if index % self.k == 0:
+                self._values.append(value)
+        elif mode == 'ring':
+            self._ring[index % self.capacity] = value
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.append(value)
+
+    def tolist(self) -> List[float]:
+        """Return the kept values, oldest first."""
+        mode = self.mode
+        if mode == 'none':
+            return []
+        if mode == 'final-only':
+            return [] if self.count == 0 else [float(self.last)]
+        if mode == 'ring':
+            if self.count <= self.capacity:
+                return self._ring[:self.count].tolist()
+            start = self.count % self.capacity
+            return np.roll(self._ring, -start).tolist()
+        return self._values.tolist()
+
+    def __len__(self) -> int:
+        mode = self.mode
+        if mode == 'none':
+            return 0
+        if mode == 'final-only':
+            return min(self.count, 1)
+        if mode == 'ring':
+            return min(self.count, self.capacity)
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if self.mode in ('all', 'improvements-only', 'every-k'):
+            return self._values[index]
+        return self.tolist()[index]
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.tolist())
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+
+def new_history(record: Union[str, ValueHistory] = 'all') -> ValueHistory:
+    """
+    Return the history an algorithm should record into: ``record`` itself if
+    it already is a ``ValueHistory`` (so callers can share one across runs),
+    otherwise a fresh history for the given mode string.
+    """
+    if isinstance(record, ValueHistory):
+        return record
+    return ValueHistory.from_mode(record)
@@ -0,0 +1,235 @@
+"""
+Move-based neighbourhood protocol for the local search algorithms.
+
+A move problem owns a mutable copy of the current state and describes the
+neighbourhood as a lazy stream of moves instead of a list of freshly built
+neighbour states. The algorithms accept a move problem anywhere they accept
+a ``get_neighbors`` callable and switch to the allocation-free loops below
+when they detect one; both ``local_search.algorithms`` and
+``ai_berkeley.local_search`` run them.
+"""
+import math
+import random
+from itertools import count
+from typing import (Any, Callable, Hashable, Iterable, Iterator, Optional, Protocol, Tuple,
+                    Union, runtime_checkable)
+
+from .budget import MAX_ITERATIONS, BudgetTracker
+from .history import ValueHistory, new_history
+
+Move = Hashable
+
+
+@runtime_checkable
+class MoveProblem(Protocol):
+    """
+    Protocol for problems that expose their neighbourhood as moves.
+
+    ``delta`` must be expressed in the units of the ``evaluate`` function
+    passed alongside the problem, i.e. ``evaluate(after) - evaluate(before)``.
+    Implementations are also callable as ``get_neighbors(state)`` so they
+    stay usable by code that only understands neighbour lists.
+
+    Problems may additionally provide ``random_move(rng)``, returning one
+    uniformly drawn move without enumerating the neighbourhood, or None
+    when there are no moves; simulated annealing uses it when present. Likewise ``best_move(rng)`` may return
+    the ``(move, delta)`` pair with the largest delta, ties broken uniformly
+    at random, or None when there are no moves; steepest-ascent hill
+    climbing then skips its own scan.
+    """
+
+    def reset(self, state: Any) -> None:
+        """Load ``state`` as the current state."""
+        ...
+
+    def state(self) -> Any:
+        """Return an immutable snapshot of the current state."""
+        ...
+
+    def moves(self) -> Iterator[Move]:
+        """Lazily yield every move available from the current state."""
+        ...
+
+    def delta(self, move: Move) -> float:
+        """Return the change in value that applying ``move`` would cause."""
+        ...
+
+    def apply(self, move: Move) -> None:
+        """Apply ``move`` to the current state in place."""
+        ...
+
+    def undo(self, move: Move) -> None:
+        """Revert ``move``, which must be the most recently applied one."""
+        ...
+
+
+def is_move_problem(obj: Any) -> bool:
+    """Return True if ``obj`` implements the ``MoveProblem`` protocol."""
+    return isinstance(obj, MoveProblem)
+
+
+def _iterations(max_iterations: Optional[int]) -> Iterable[int]:
+    return count() if max_iterations is None else range(max_iterations)
+
+
+def steepest_moves(
+    initial_state: Any,
+    problem: MoveProblem,
+    evaluate: Callable[[Any], float],
+    record: Union[str, ValueHistory],
+    tracker: BudgetTracker,
+    max_iterations: Optional[int] = None
+) -> Tuple[Any, ValueHistory]:
+    """
+    Steepest-ascent hill climbing over a move problem.
+    Scans moves by delta; ties keep the first best move, as max() does.
+    Problems providing best_move pick it themselves, breaking ties at random,
+    unless the budget limits evaluations and every delta has to be counted.
+    A run that uses up max_iterations stops with MAX_ITERATIONS.
+    """
+    problem.reset(initial_state)
+    current_value = evaluate(initial_state)
+    value_history = new_history(record)
+    value_history.append(current_value)
+    best_move_of = None if tracker.limits_evaluations else getattr(problem, 'best_move', None)
+
+    stop_reason = 'local_optimum'
+    for _ in _iterations(max_iterations):
+        if not tracker.next_iteration():
+            break
+        best_move = None
+        best_delta = None
+        if best_move_of is not None:
+            best = best_move_of(random)
+            if best is not None:
+                best_move, best_delta = best
+        else:
+            for move in problem.moves():
+                delta = problem.delta(move)
+                tracker.evaluations += 1
+                if best_delta is None or delta > best_delta:
+                    best_move, best_delta = move, delta
+
+        if best_move is None or best_delta <= 0:
+            break
+
+        problem.apply(best_move)
+        current_value += best_delta
+        value_history.append(current_value)
+    else:
+        stop_reason = MAX_ITERATIONS
+
+    value_history.stop_reason = tracker.stop_reason or stop_reason
+    return problem.state(), value_history
+
+
+def first_choice_moves(
+    initial_state: Any,
+    problem: MoveProblem,
+    evaluate: Callable[[Any], float],
+    record: Union[str, ValueHistory],
+    tracker: BudgetTracker,
+    max_iterations: Optional[int] = None
+) -> Tuple[Any, ValueHistory]:
+    """
+    First-choice hill climbing over a move problem: moves are tried in
+    random order and the first improving one is taken.
+    """
+    problem.reset(initial_state)
+    current_value = evaluate(initial_state)
+    value_history = new_history(record)
+    value_history.append(current_value)
+
+    stop_reason = 'local_optimum'
+    for _ in _iterations(max_iterations):
+        if not tracker.next_iteration():
+            break
+        moves = list(problem.moves())
+        if not moves:
+            break
+
+        random.shuffle(moves)
+
+        improved = False
+        for move in moves:
+            delta = problem.delta(move)
+            tracker.evaluations += 1
+            if delta > 0:
+                problem.apply(move)
+                current_value += delta
+                value_history.append(current_value)
+                improved = True
+                break
+
+        if not improved:
+            break
+    else:
+        stop_reason = MAX_ITERATIONS
+
+    value_history.stop_reason = tracker.stop_reason or stop_reason
+    return problem.state(), value_history
+
+
+def annealing_moves(
+    initial_state: Any,
+    problem: MoveProblem,
+    evaluate: Callable[[Any], float],
+    schedule: Callable[[int], float],
+    record: Union[str, ValueHistory],
+    tracker: BudgetTracker,
+    times: Iterable[int],
+    exhausted: str = 'schedule',
+    return_best: bool = False
+) -> Tuple[Any, ValueHistory]:
+    """
+    Simulated annealing over a move problem, at the temperatures
+    schedule(t) for t in times; a temperature of zero or less ends the run.
+    Draws moves with problem.random_move when the problem provides it; a
+    None move, like an empty moves(), ends the run.
+
+    A run that uses up times stops with the exhausted reason. The best state
+    seen is returned if return_best is set or the budget ran out, otherwise
+    the final state.
+    """
+    problem.reset(initial_state)
+    current_value = evaluate(initial_state)
+    best_state = initial_state
+    best_value = current_value
+    value_history = new_history(record)
+    value_history.append(current_value)
+    random_move = getattr(problem, 'random_move', None)
+
+    stop_reason = 'schedule'
+    for t in times:
+        if not tracker.next_iteration():
+            break
+        temperature = schedule(t)
+        if temperature <= 0:
+            break
+
+        if random_move is not None:
+            move = random_move(random)
+            if move is None:
+                break
+        else:
+            moves = list(problem.moves())
+            if not moves:
+                break
+            move = random.choice(moves)
+        delta_e = problem.delta(move)
+        tracker.evaluations += 1
+
+        if delta_e > 0 or random.random() < math.exp(delta_e / temperature):
+            problem.apply(move)
+            current_value += delta_e
+            value_history.append(current_value)
+            if current_value > best_value:
+                best_state = problem.state()
+                best_value = current_value
+    else:
+        stop_reason = exhausted
+
+    value_history.stop_reason = tracker.stop_reason or stop_reason
+    if return_best or tracker.stop_reason:
+        return best_state, value_history
+    return problem.state(), value_history
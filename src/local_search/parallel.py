@@ -0,0 +1,128 @@
+"""
+Process-parallel random-restart hill climbing.
+"""
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .algorithms import hill_climbing_steepest
+
+# Set in each worker by _init_worker: the lowest restart index known to have
+# reached the target. Queued restarts above it stand down.
+_cutoff = None
+
+
+def _init_worker(cutoff) -> None:
+    global _cutoff
+    _cutoff = cutoff
+
+
+def _run_restart(
+    restart: int,
+    seed: int,
+    get_neighbors: Callable[[Any], List[Any]],
+    evaluate: Callable[[Any], float],
+    generate_random_state: Callable[[], Any]
+) -> Optional[Dict[str, Any]]:
+    """Run one seeded restart in a worker; return None if an earlier restart hit the target."""
+    if _cutoff is not None and restart > _cutoff.value:
+        return None
+    # Seed the global generator the problem helpers draw from
+    random.seed(seed)
+    start_time = time.perf_counter()
+    initial_state = generate_random_state()
+    final_state, value_history = hill_climbing_steepest(initial_state, get_neighbors, evaluate)
+    return {
+        'Restart': restart,
+        'Seed': seed,
+        'Status': 'completed',
+        'Initial Value': value_history.first,
+        'Final Value': value_history.last,
+        'Steps': value_history.count - 1,
+        'Runtime': time.perf_counter() - start_time,
+        'Final State': final_state,
+        'Value History': value_history
+    }
+
+
+def hill_climbing_random_restart_parallel(
+    initial_state: Any,
+    get_neighbors: Callable[[Any], List[Any]],
+    evaluate: Callable[[Any], float],
+    generate_random_state: Callable[[], Any],
+    max_restarts: int = 10,
+    target_value: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    seed: Optional[int] = None
+) -> Tuple[Any, List[float], List[Dict[str, Any]]]:
+    """
+    Random restart hill climbing with the restarts spread over a process pool.
+
+    Every restart gets its own seed spawned from ``seed`` (a NumPy
+    SeedSequence). Once a restart reaches ``target_value`` (e.g. 0 for
+    negated conflicts or Manhattan distance), restarts with a higher index
+    are cancelled, while lower ones still run, so the result is the one a
+    sequential run stopping at the first restart to hit the target would
+    give. With a fixed ``seed`` everything but the runtimes is therefore
+    reproducible regardless of scheduling. The callables are sent to worker
+    processes and must therefore be picklable (module-level functions or
+    objects, not lambdas).
+
+    Returns the best state (the first best in restart order), the value
+    histories of the completed restarts in restart order, and one
+    statistics row per restart with its status ('completed' or
+    'cancelled').
+    """
+    seeds = [int(child.generate_state(1)[0])
+             for child in np.random.SeedSequence(seed).spawn(max_restarts)]
+    stats: List[Dict[str, Any]] = [
+        {'Restart': restart, 'Seed': restart_seed, 'Status': 'cancelled'}
+        for restart, restart_seed in enumerate(seeds)
+    ]
+
+    context = multiprocessing.get_context()
+    cutoff = context.Value('q', max_restarts)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_init_worker, initargs=(cutoff,)) as executor:
+        futures = {
+            executor.submit(_run_restart, restart, restart_seed,
+                            get_neighbors, evaluate, generate_random_state): restart
+            for restart, restart_seed in enumerate(seeds)
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            result = future.result()
+            restart = futures[future]
+            if result is None or restart > cutoff.value:
+                continue  # Stays 'cancelled'
+            stats[restart] = result
+            if target_value is not None and result['Final Value'] >= target_value:
+                with cutoff.get_lock():
+                    cutoff.value = min(cutoff.value, restart)
+                for pending, index in futures.items():
+                    if index > restart:
+                        pending.cancel()
+
+    # Restarts above the cutoff may have finished before it was lowered;
+    # drop them so the outcome does not depend on scheduling
+    for restart in range(cutoff.value + 1, max_restarts):
+        stats[restart] = {'Restart': restart, 'Seed': seeds[restart], 'Status': 'cancelled'}
+
+    best_state = initial_state
+    best_value = evaluate(initial_state)
+    all_value_history = []
+    for row in stats:
+        if row['Status'] != 'completed':
+            continue
+        all_value_history.extend(row.pop('Value History'))
+        final_state = row.pop('Final State')
+        if row['Final Value'] > best_value:
+            best_state = final_state
+            best_value = row['Final Value']
+
+    return best_state, all_value_history, stats
@@ -0,0 +1,74 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.puzzle8.board import PuzzleBatch
+from src.puzzle8.generator import generate_8puzzle_instance, get_manhattan_distance
+from src.queens8.board import QueensBatch
+from src.queens8.generator import count_conflicts
+from src.local_search.algorithms import exponential_schedule
+from src.local_search.batched import batched_simulated_annealing
+
+
+class TestBatchProblems(unittest.TestCase):
+    def check_batch(self, batch, value_of, steps=200):
+        """delta and apply of every chain agree with the scalar evaluator."""
+        rng = np.random.default_rng(0)
+        for _ in range(steps):
+            before = [tuple(state) for state in batch.states.tolist()]
+            np.testing.assert_array_equal(batch.values(), [value_of(s) for s in before])
+            proposal = batch.propose(rng)
+            delta = batch.delta(proposal)
+            accepted = rng.random(len(before)) < 0.5
+            batch.apply(proposal, accepted)
+            after = [tuple(state) for state in batch.states.tolist()]
+            for k, (old, new) in enumerate(zip(before, after)):
+                if accepted[k]:
+                    self.assertNotEqual(new, old)
+                    self.assertEqual(delta[k], value_of(new) - value_of(old))
+                else:
+                    self.assertEqual(new, old)
+        np.testing.assert_array_equal(batch.values(), [value_of(tuple(s)) for s in batch.states.tolist()])
+
+    def test_queens_batch(self):
+        rng = random.Random(1)
+        for n in (4, 8, 15):
+            states = [[rng.randrange(n) for _ in range(n)] for _ in range(16)]
+            self.check_batch(QueensBatch(states), lambda s: -count_conflicts(s))
+
+    def test_puzzle_batch(self):
+        random.seed(2)
+        states = [generate_8puzzle_instance() for _ in range(16)]
+        self.check_batch(PuzzleBatch(states), lambda s: -get_manhattan_distance(s))
+
+    def test_shape_checked(self):
+        with self.assertRaises(ValueError):
+            QueensBatch([0, 1, 2])
+        with self.assertRaises(ValueError):
+            PuzzleBatch([[0, 1, 2]])
+
+
+class TestBatchedSimulatedAnnealing(unittest.TestCase):
+    def test_histories_match_final_states(self):
+        """Each chain's history starts at its initial value and ends at its final value."""
+        rng = random.Random(3)
+        states = [tuple(rng.randrange(8) for _ in range(8)) for _ in range(10)]
+        results = batched_simulated_annealing(QueensBatch(states), exponential_schedule(k=5, lam=0.01),
+                                              max_iterations=300, rng=np.random.default_rng(3))
+        self.assertEqual(len(results), len(states))
+        for initial, (final, history) in zip(states, results):
+            self.assertEqual(history[0], -count_conflicts(initial))
+            self.assertEqual(history[-1], -count_conflicts(final))
+
+    def test_seeded_runs_repeat(self):
+        states = [[1, 0, 2, 3, 4, 5, 6, 7, 8]] * 4
+        first = batched_simulated_annealing(PuzzleBatch(states), exponential_schedule(),
+                                            max_iterations=100, rng=np.random.default_rng(4))
+        second = batched_simulated_annealing(PuzzleBatch(states), exponential_schedule(),
+                                             max_iterations=100, rng=np.random.default_rng(4))
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from src.queens8.board import QueensMoves
+from src.queens8.generator import count_conflicts, get_neighbors, random_neighbor
+from src.local_search.algorithms import (hill_climbing_first_choice, hill_climbing_random_restart,
+                                         hill_climbing_steepest, simulated_annealing)
+from src.local_search.budget import DEADLINE, MAX_EVALUATIONS, MAX_ITERATIONS, Budget, start_budget
+
+# All queens on one row: a long climb before any local optimum
+INITIAL_STATE = (0,) * 20
+
+
+def evaluate(state):
+    return -count_conflicts(state)
+
+
+def constant_schedule(t):
+    """A temperature that never runs out, so only a cap can end the run."""
+    return 1.0
+
+
+class TestBudget(unittest.TestCase):
+    def climbers(self):
+        """Each algorithm on the list-based and the move-based neighbourhood."""
+        restart = lambda: tuple(random.randrange(20) for _ in range(20))
+        for neighbors in (get_neighbors, QueensMoves()):
+            yield hill_climbing_steepest, (neighbors, evaluate)
+            yield hill_climbing_first_choice, (neighbors, evaluate)
+            yield hill_climbing_random_restart, (neighbors, evaluate, restart)
+            yield simulated_annealing, (neighbors, evaluate, constant_schedule)
+
+    def run_all(self, budget):
+        for algorithm, args in self.climbers():
+            random.seed(0)
+            tracker = start_budget(budget)
+            state, history = algorithm(INITIAL_STATE, *args, budget=tracker)
+            yield algorithm, tracker, state, history
+
+    def test_max_iterations(self):
+        for algorithm, tracker, state, history in self.run_all(Budget(max_iterations=5)):
+            with self.subTest(algorithm=algorithm.__name__):
+                self.assertEqual(history.stop_reason, MAX_ITERATIONS)
+                self.assertEqual(tracker.iterations, 5)
+                self.assertLessEqual(history.count - 1, 5)
+                self.assertGreaterEqual(evaluate(state), evaluate(INITIAL_STATE))
+
+    def test_max_evaluations(self):
+        for algorithm, tracker, state, history in self.run_all(Budget(max_evaluations=50)):
+            with self.subTest(algorithm=algorithm.__name__):
+                self.assertEqual(history.stop_reason, MAX_EVALUATIONS)
+                self.assertGreaterEqual(tracker.evaluations, 50)
+                self.assertGreaterEqual(evaluate(state), evaluate(INITIAL_STATE))
+
+    def test_deadline(self):
+        for algorithm, tracker, state, history in self.run_all(Budget(time_limit=0)):
+            with self.subTest(algorithm=algorithm.__name__):
+                self.assertEqual(history.stop_reason, DEADLINE)
+                self.assertEqual(tracker.iterations, 0)
+                self.assertEqual(history.count, 1)
+
+    def test_natural_end(self):
+        expected = {'hill_climbing_steepest': 'local_optimum', 'hill_climbing_first_choice': 'local_optimum',
+                    'hill_climbing_random_restart': 'restarts', 'simulated_annealing': 'schedule'}
+        for algorithm, tracker, state, history in self.run_all(None):
+            with self.subTest(algorithm=algorithm.__name__):
+                self.assertEqual(history.stop_reason, expected[algorithm.__name__])
+                self.assertIsNone(tracker.stop_reason)
+
+    def test_annealing_cap(self):
+        """Without limits annealing stops after 999 iterations; a limit lifts the cap."""
+        for neighbors, kwargs in ((get_neighbors, {}), (get_neighbors, {'random_neighbor': random_neighbor}),
+                                  (QueensMoves(), {})):
+            for budget in (None, Budget()):
+                random.seed(1)
+                tracker = start_budget(budget)
+                _, history = simulated_annealing(INITIAL_STATE, neighbors, evaluate, constant_schedule,
+                                                 budget=tracker, **kwargs)
+                self.assertEqual(tracker.iterations, 999)
+                self.assertEqual(history.stop_reason, 'schedule')
+            random.seed(1)
+            tracker = Budget(max_iterations=1500).start()
+            _, history = simulated_annealing(INITIAL_STATE, neighbors, evaluate, constant_schedule,
+                                             budget=tracker, **kwargs)
+            self.assertEqual(tracker.iterations, 1500)
+            self.assertEqual(history.stop_reason, MAX_ITERATIONS)
+
+    def test_budget_is_reusable(self):
+        """Every run draws a fresh tracker, so one budget gives repeatable runs."""
+        budget = Budget(max_iterations=4)
+        runs = []
+        for _ in range(2):
+            random.seed(2)
+            state, history = hill_climbing_first_choice(INITIAL_STATE, QueensMoves(), evaluate, budget=budget)
+            runs.append((state, history.tolist(), history.stop_reason))
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(runs[0][2], MAX_ITERATIONS)
+
+    def test_limits_validated(self):
+        for kwargs in ({'max_iterations': -1}, {'max_evaluations': -1}, {'time_limit': -0.5}):
+            with self.assertRaises(ValueError):
+                Budget(**kwargs)
+        self.assertFalse(Budget().start().has_limits)
+        self.assertTrue(Budget(time_limit=1).start().has_limits)
+        self.assertTrue(Budget(max_evaluations=1).start().limits_evaluations)
+
+
+if __name__ == '__main__':
+    unittest.main()
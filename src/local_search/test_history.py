@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from src.queens8.board import QueensMoves
+from src.queens8.generator import count_conflicts, generate_8queens_state
+from src.local_search.algorithms import hill_climbing_first_choice
+from src.local_search.history import ValueHistory, new_history
+
+VALUES = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0, 5.0]
+
+
+class TestValueHistory(unittest.TestCase):
+    def recorded(self, record, values=VALUES):
+        history = new_history(record)
+        history.extend(values)
+        return history
+
+    def check_kept(self, history, expected):
+        self.assertEqual(history.tolist(), expected)
+        self.assertEqual(len(history), len(expected))
+        self.assertEqual(list(history), expected)
+        if expected:
+            self.assertEqual(history[0], expected[0])
+            self.assertEqual(history[-1], expected[-1])
+
+    def test_modes(self):
+        """Each mode keeps its values; the counters see every value."""
+        cases = {
+            'all': VALUES,
+            'none': [],
+            'final-only': [5.0],
+            'improvements-only': [3.0, 4.0, 5.0, 9.0],
+            'every-1': VALUES,
+            'every-3': [3.0, 1.0, 2.0, 3.0],
+            'ring-4': [6.0, 5.0, 3.0, 5.0],
+            'ring-20': VALUES,
+        }
+        for record, expected in cases.items():
+            with self.subTest(record=record):
+                history = self.recorded(record)
+                self.check_kept(history, expected)
+                self.assertEqual(history.count, len(VALUES))
+                self.assertEqual(history.first, 3.0)
+                self.assertEqual(history.last, 5.0)
+                self.assertEqual(history.best, 9.0)
+
+    def test_ring_wraps_around(self):
+        """The ring keeps the n most recent values, oldest first, at every length."""
+        history = new_history('ring-5')
+        for count in range(1, 23):
+            history.append(float(count))
+            self.check_kept(history, [float(v) for v in range(max(1, count - 4), count + 1)])
+
+    def test_empty(self):
+        for record in ('all', 'none', 'final-only', 'improvements-only', 'every-2', 'ring-3'):
+            history = new_history(record)
+            self.assertEqual(history.tolist(), [])
+            self.assertEqual(len(history), 0)
+            self.assertEqual(history.count, 0)
+            self.assertIsNone(history.last)
+
+    def test_parse_mode(self):
+        every = ValueHistory.from_mode('every-10')
+        self.assertEqual((every.mode, every.k), ('every-k', 10))
+        ring = ValueHistory.from_mode('ring-250')
+        self.assertEqual((ring.mode, ring.capacity), ('ring', 250))
+        self.assertEqual(ValueHistory.from_mode('every-k').k, 1)
+        self.assertEqual(ValueHistory.from_mode('ring').capacity, 1000)
+        for record in ('every-x', 'ring-', 'every-0', 'ring--3', 'last', 'ALL'):
+            with self.subTest(record=record), self.assertRaises(ValueError):
+                ValueHistory.from_mode(record)
+
+    def test_new_history_shares_instance(self):
+        history = ValueHistory('ring', capacity=2)
+        self.assertIs(new_history(history), history)
+        self.assertEqual(new_history().mode, 'all')
+
+    def test_algorithms_record_same_run(self):
+        """Only what is kept changes with the mode; the run itself does not."""
+        random.seed(0)
+        initial_state = generate_8queens_state()
+        evaluate = lambda state: -count_conflicts(state)
+        runs = {}
+        for record in ('all', 'none', 'final-only', 'ring-3'):
+            random.seed(1)
+            runs[record] = hill_climbing_first_choice(initial_state, QueensMoves(), evaluate, record=record)
+        final_state, full = runs['all']
+        for record, (state, history) in runs.items():
+            self.assertEqual(state, final_state)
+            self.assertEqual(history.count, full.count)
+            self.assertEqual(history.last, full.last)
+            self.assertEqual(history.stop_reason, full.stop_reason)
+        self.assertEqual(runs['ring-3'][1].tolist(), full.tolist()[-3:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.queens8.generator import count_conflicts, generate_8queens_state, get_neighbors
+from src.local_search.parallel import hill_climbing_random_restart_parallel
+
+
+# Worker processes need picklable, module-level callables
+def negated_conflicts(state):
+    return -count_conflicts(state)
+
+
+def run(seed, max_workers, target_value=None, max_restarts=30):
+    return hill_climbing_random_restart_parallel(
+        generate_8queens_state(), get_neighbors, negated_conflicts, generate_8queens_state,
+        max_restarts=max_restarts, target_value=target_value, max_workers=max_workers, seed=seed)
+
+
+def without_runtime(stats):
+    return [{key: value for key, value in row.items() if key != 'Runtime'} for row in stats]
+
+
+class TestParallelRestarts(unittest.TestCase):
+    def test_seeded_runs_repeat(self):
+        """The same seed gives the same restarts whatever the worker count."""
+        state, histories, stats = run(seed=1, max_workers=1)
+        for max_workers in (1, 4):
+            other_state, other_histories, other_stats = run(seed=1, max_workers=max_workers)
+            self.assertEqual(other_state, state)
+            self.assertEqual(other_histories, histories)
+            self.assertEqual(without_runtime(other_stats), without_runtime(stats))
+        self.assertTrue(all(row['Status'] == 'completed' for row in stats))
+        self.assertNotEqual(without_runtime(run(seed=2, max_workers=4)[2]), without_runtime(stats))
+
+    def test_target_cancels_later_restarts(self):
+        """Restarts after the first to hit the target are cancelled, deterministically."""
+        state, histories, stats = run(seed=3, max_workers=1, target_value=0)
+        statuses = [row['Status'] for row in stats]
+        first_hit = statuses.index('cancelled') - 1
+        self.assertEqual(statuses, ['completed'] * (first_hit + 1) + ['cancelled'] * (30 - first_hit - 1))
+        self.assertTrue(all(row['Final Value'] < 0 for row in stats[:first_hit]))
+        self.assertEqual(stats[first_hit]['Final Value'], 0)
+        self.assertEqual(count_conflicts(state), 0)
+        self.assertEqual(histories[-1], 0)
+        for _ in range(3):
+            other_state, other_histories, other_stats = run(seed=3, max_workers=4, target_value=0)
+            self.assertEqual(other_state, state)
+            self.assertEqual(other_histories, histories)
+            self.assertEqual(without_runtime(other_stats), without_runtime(stats))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Mutable 8-puzzle board for move-based local search.
+"""
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .generator import apply_move, get_manhattan_distance, get_valid_moves
+
+GOAL = (0, 1, 2, 3, 4, 5, 6, 7, 8)
+
+# Manhattan distance between every pair of cells on the 3x3 grid.
+CELL_DISTANCE = [[abs(p // 3 - q // 3) + abs(p % 3 - q % 3) for q in range(9)]
+                 for p in range(9)]
+
+# Moves of the blank for every blank position, as (blank, target) pairs, in
+# the same order as get_valid_moves: up, down, left, right.
+MOVE_TABLE: List[Tuple[Tuple[int, int], ...]] = [
+    tuple((blank, blank + offset)
+          for name, offset in (('up', -3), ('down', 3), ('left', -1), ('right', 1))
+          if name in get_valid_moves(blank))
+    for blank in range(9)
+]
+
+
+@lru_cache(maxsize=None)
+def manhattan_delta_table(goal: Tuple[int, ...] = GOAL) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Return ``table[tile][from_pos][to_pos]``, the change in the Manhattan
+    distance to ``goal`` when ``tile`` slides from ``from_pos`` to
+    ``to_pos``. Entries for the blank (tile 0) are zero.
+    """
+    goal_pos = [0] * 9
+    for pos, tile in enumerate(goal):
+        goal_pos[tile] = pos
+    return tuple(
+        tuple(tuple(0 if tile == 0 else CELL_DISTANCE[to_pos][goal_pos[tile]]
+                    - CELL_DISTANCE[from_pos][goal_pos[tile]]
+                    for to_pos in range(9))
+              for from_pos in range(9))
+        for tile in range(9)
+    )
+
+
+class IncrementalManhattan:
+    """
+    Drop-in replacement for ``get_manhattan_distance`` that follows the most
+    recently evaluated state.
+
+    When a query is one slide away from that state (as every neighbour in
+    the local search algorithms is), the distance is updated with one
+    ``manhattan_delta_table`` lookup instead of walking all nine tiles;
+    anything else is scored from scratch.
+    """
+
+    def __init__(self, goal: Tuple[int, ...] = GOAL):
+        self.goal = goal
+        self.table = manhattan_delta_table(goal)
+        self.state: Optional[Tuple[int, ...]] = None
+        self.blank = 0
+        self.distance = 0
+
+    def __call__(self, state: Tuple[int, ...]) -> int:
+        previous = self.state
+        if previous is not None:
+            if state == previous:
+                return self.distance
+            blank = self.blank
+            for _, target in MOVE_TABLE[blank]:
+                if state[target] == 0:
+                    tile = state[blank]
+                    moved = list(previous)
+                    moved[blank], moved[target] = tile, 0
+                    if tuple(moved) == state:
+                        self.distance += self.table[tile][target][blank]
+                        self.state = state
+                        self.blank = target
+                        return self.distance
+                    break
+        self.state = state
+        self.blank = state.index(0)
+        self.distance = get_manhattan_distance(state, self.goal)
+        return self.distance
+
+
+class PuzzleMoves:
+    """
+    Move-based neighbourhood for the 8-puzzle (see ``local_search.moves``).
+
+    A move is a ``(blank, target)`` pair taken from ``MOVE_TABLE``: the tile
+    at ``target`` slides into the blank. Values follow the experiments'
+    convention of maximizing ``-get_manhattan_distance(state, goal)``; a
+    move's delta is one ``manhattan_delta_table`` lookup.
+    """
+
+    def __init__(self, goal: Tuple[int, ...] = GOAL):
+        self.goal = goal
+        self.delta_table = manhattan_delta_table(goal)
+        self.tiles: List[int] = list(goal)
+        self.blank = goal.index(0)
+
+    def __call__(self, state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [apply_move(state, m) for m in get_valid_moves(state.index(0))]
+
+    def reset(self, state: Tuple[int, ...]) -> None:
+        self.tiles = list(state)
+        self.blank = self.tiles.index(0)
+
+    def state(self) -> Tuple[int, ...]:
+        return tuple(self.tiles)
+
+    def moves(self) -> Iterator[Tuple[int, int]]:
+        return iter(MOVE_TABLE[self.blank])
+
+    def random_move(self, rng) -> Tuple[int, int]:
+        return rng.choice(MOVE_TABLE[self.blank])
+
+    def delta(self, move: Tuple[int, int]) -> int:
+        blank, target = move
+        # The tile moves from target to blank; values are negated distances
+        return -self.delta_table[self.tiles[target]][target][blank]
+
+    def apply(self, move: Tuple[int, int]) -> None:
+        blank, target = move
+        tiles = self.tiles
+        tiles[blank] = tiles[target]
+        tiles[target] = 0
+        self.blank = target
+
+    def undo(self, move: Tuple[int, int]) -> None:
+        blank, target = move
+        tiles = self.tiles
+        tiles[target] = tiles[blank]
+        tiles[blank] = 0
+        self.blank = blank
+
+
+class PuzzleBatch:
+    """
+    K independent 8-puzzle boards held as arrays, for lock-step algorithms
+    such as ``local_search.batched.batched_simulated_annealing``.
+
+    A proposal slides a uniformly chosen neighbouring tile into each blank,
+    like ``PuzzleMoves.random_move``; values are ``-get_manhattan_distance``.
+    """
+
+    _CELL_DISTANCE = np.array(CELL_DISTANCE, dtype=np.int64)
+    _TARGETS = np.array([[target for _, target in moves] + [0] * (4 - len(moves))
+                         for moves in MOVE_TABLE], dtype=np.int64)
+    _NUM_TARGETS = np.array([len(moves) for moves in MOVE_TABLE], dtype=np.int64)
+
+    def __init__(self, states, goal: Tuple[int, ...] = GOAL):
+        states = np.array(states, dtype=np.int64)
+        if states.ndim != 2 or states.shape[1] != 9:
+            raise ValueError(f"Expected a (K, 9) array of states, got shape {states.shape}")
+        self.goal = goal
+        self.goal_pos = np.argsort(np.array(goal))
+        self.states = states
+        self._chains = np.arange(len(states))
+        self.blank = np.argmin(states, axis=1)
+        distance = self._CELL_DISTANCE[np.arange(9), self.goal_pos[states]]
+        self.distance = np.where(states != 0, distance, 0).sum(axis=1)
+
+    def values(self) -> np.ndarray:
+        return -self.distance
+
+    def propose(self, rng: np.random.Generator) -> np.ndarray:
+        num_targets = self._NUM_TARGETS[self.blank]
+        choice = (rng.random(len(self._chains)) * num_targets).astype(np.int64)
+        return self._TARGETS[self.blank, choice]
+
+    def delta(self, proposal: np.ndarray) -> np.ndarray:
+        goal = self.goal_pos[self.states[self._chains, proposal]]
+        return self._CELL_DISTANCE[proposal, goal] - self._CELL_DISTANCE[self.blank, goal]
+
+    def apply(self, proposal: np.ndarray, accepted: np.ndarray) -> None:
+        chains = np.flatnonzero(accepted)
+        blank = self.blank[chains]
+        target = proposal[chains]
+        tile = self.states[chains, target]
+        goal = self.goal_pos[tile]
+        self.distance[chains] += self._CELL_DISTANCE[blank, goal] - self._CELL_DISTANCE[target, goal]
+        self.states[chains, blank] = tile
+        self.states[chains, target] = 0
+        self.blank[chains] = target
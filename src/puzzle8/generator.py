@@ -100,6 +100,13 @@ def apply_move(state: Tuple[int, ...], move: str) -> Tuple[int, ...]:
     state_list[blank_pos], state_list[new_pos] = state_list[new_pos], state_list[blank_pos]
     return tuple(state_list)
 
+def random_neighbor(state: Tuple[int, ...], rng=random) -> Tuple[int, ...]:
+    """
+    Return one neighbor drawn uniformly from the valid moves of the blank,
+    without building the other neighbor states.
+    """
+    return apply_move(state, rng.choice(get_valid_moves(get_blank_position(state))))
+
 def print_state(state: Tuple[int, ...]) -> None:
     """Print the puzzle state in a grid format."""
     for i in range(0, 9, 3):
@@ -0,0 +1,147 @@
+"""
+Exact distance oracle for the 8-puzzle.
+
+A single backward breadth-first search from the goal labels every one of the
+9!/2 = 181,440 solvable states with its optimal solution length. Distances
+are stored in a ``uint8`` table indexed by the Lehmer-code rank of the
+permutation (9! entries; unreachable states hold ``UNREACHABLE``), saved as
+a ``.npy`` file and memory-mapped on load. Worker processes that open the
+same file share its pages instead of each holding a copy.
+"""
+from math import factorial
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .board import GOAL, MOVE_TABLE
+
+UNREACHABLE = 255
+NUM_PERMUTATIONS = factorial(9)
+DATA_DIR = Path(__file__).resolve().parents[2] / 'data'
+
+_FACTORIALS = [factorial(8 - i) for i in range(9)]
+
+
+def rank(state: Tuple[int, ...]) -> int:
+    """Return the Lehmer-code rank of a state, in ``range(9!)``."""
+    r = 0
+    for i in range(8):
+        tile = state[i]
+        smaller = 0
+        for j in range(i + 1, 9):
+            if state[j] < tile:
+                smaller += 1
+        r += smaller * _FACTORIALS[i]
+    return r
+
+
+def unrank(r: int) -> Tuple[int, ...]:
+    """Inverse of ``rank``."""
+    remaining = list(range(9))
+    state = []
+    for i in range(9):
+        index, r = divmod(r, _FACTORIALS[i])
+        state.append(remaining.pop(index))
+    return tuple(state)
+
+
+def rank_batch(states: np.ndarray) -> np.ndarray:
+    """Rank every row of an (m, 9) array of states at once."""
+    states = np.asarray(states)
+    ranks = np.zeros(len(states), dtype=np.int64)
+    for i in range(8):
+        smaller = (states[:, i + 1:] < states[:, i:i + 1]).sum(axis=1)
+        ranks += smaller * _FACTORIALS[i]
+    return ranks
+
+
+def build_distance_table(goal: Tuple[int, ...] = GOAL) -> np.ndarray:
+    """
+    Breadth-first search backwards from ``goal`` over the whole state space.
+    Each layer is expanded as one array: successors of all frontier states
+    are built with fancy indexing, ranked together and deduplicated.
+    """
+    table = np.full(NUM_PERMUTATIONS, UNREACHABLE, dtype=np.uint8)
+    frontier = np.array([goal], dtype=np.uint8)
+    table[rank_batch(frontier)] = 0
+    depth = 0
+    while len(frontier):
+        depth += 1
+        blanks = np.argmin(frontier, axis=1)
+        successors = []
+        for blank in range(9):
+            boards = frontier[blanks == blank]
+            if not len(boards):
+                continue
+            for _, target in MOVE_TABLE[blank]:
+                moved = boards.copy()
+                moved[:, blank] = moved[:, target]
+                moved[:, target] = 0
+                successors.append(moved)
+        successors = np.concatenate(successors)
+        ranks = rank_batch(successors)
+        new = table[ranks] == UNREACHABLE
+        ranks, first = np.unique(ranks[new], return_index=True)
+        table[ranks] = depth
+        frontier = successors[new][first]
+    return table
+
+
+def table_path(goal: Tuple[int, ...] = GOAL, directory: Path = DATA_DIR) -> Path:
+    """Return where the distance table for ``goal`` is stored."""
+    return Path(directory) / f"puzzle8_distances_{''.join(map(str, goal))}.npy"
+
+
+def load_distance_table(goal: Tuple[int, ...] = GOAL, path: Optional[Path] = None) -> np.ndarray:
+    """
+    Memory-map the distance table for ``goal``, building and saving it first
+    if the file does not exist yet.
+    """
+    path = Path(path) if path is not None else table_path(goal)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, build_distance_table(goal))
+    return np.load(path, mmap_mode='r')
+
+
+class DistanceOracle:
+    """
+    O(1) optimal distances and moves for the 8-puzzle.
+
+    Callable as ``oracle(state)``, so it doubles as a perfect heuristic
+    wherever a state -> distance function is expected.
+    """
+
+    def __init__(self, goal: Tuple[int, ...] = GOAL, path: Optional[Path] = None):
+        self.goal = goal
+        self.table = load_distance_table(goal, path)
+
+    def distance(self, state: Tuple[int, ...]) -> int:
+        """Return the optimal number of moves from ``state`` to the goal."""
+        d = int(self.table[rank(state)])
+        if d == UNREACHABLE:
+            raise ValueError(f"State {state} cannot reach the goal {self.goal}")
+        return d
+
+    __call__ = distance
+
+    def best_moves(self, state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        """Return every neighbour of ``state`` that lies on an optimal path."""
+        d = self.distance(state)
+        best = []
+        blank = state.index(0)
+        for _, target in MOVE_TABLE[blank]:
+            moved = list(state)
+            moved[blank], moved[target] = moved[target], 0
+            moved = tuple(moved)
+            if self.table[rank(moved)] == d - 1:
+                best.append(moved)
+        return best
+
+    def solve(self, state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        """Return an optimal path of states from ``state`` to the goal."""
+        path = [state]
+        while path[-1] != self.goal:
+            path.append(self.best_moves(path[-1])[0])
+        return path
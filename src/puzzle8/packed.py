@@ -0,0 +1,163 @@
+"""
+Packed-integer 8-puzzle states.
+
+A board is packed into one int: cell ``i`` holds its tile in bits
+``4*i .. 4*i+3`` (36 bits for the board) and the blank position sits in the
+nibble above it, bits 36-39. Codes are hashable and cheap to compare, and a
+move is a handful of shifts and masks driven by per-blank tables, with no
+tuple copies and no ``state.index(0)`` scans.
+
+A move is identified by its target cell: the tile there slides into the
+blank. ``encode``/``decode`` convert to and from the tuple states used
+elsewhere in the package.
+"""
+import random
+from functools import lru_cache
+from math import factorial
+from typing import List, Tuple
+
+from ..ai_berkeley.search import Problem
+from .board import CELL_DISTANCE, GOAL, MOVE_TABLE
+
+CELL_BITS = 4
+CELL_MASK = 0xF
+BLANK_SHIFT = 9 * CELL_BITS
+BOARD_MASK = (1 << BLANK_SHIFT) - 1
+
+# Target cells reachable from every blank position, in MOVE_TABLE order.
+TARGETS: List[Tuple[int, ...]] = [tuple(target for _, target in moves) for moves in MOVE_TABLE]
+
+# Lehmer-code weight of every cell: a digit in cell pos counts (8 - pos)!
+_WEIGHTS = [factorial(8 - pos) for pos in range(9)]
+# Number of set bits of every 9-bit tile mask
+_POPCOUNT = bytes(bin(mask).count('1') for mask in range(1 << 9))
+
+
+def encode(state: Tuple[int, ...]) -> int:
+    """Pack a tuple state into an int code."""
+    code = 0
+    for pos, tile in enumerate(state):
+        code |= tile << (CELL_BITS * pos)
+    return code | state.index(0) << BLANK_SHIFT
+
+
+def decode(code: int) -> Tuple[int, ...]:
+    """Unpack an int code into a tuple state."""
+    return tuple((code >> (CELL_BITS * pos)) & CELL_MASK for pos in range(9))
+
+
+def blank_of(code: int) -> int:
+    """Return the blank position of a code."""
+    return code >> BLANK_SHIFT
+
+
+def slide(code: int, target: int) -> int:
+    """Slide the tile at ``target`` into the blank and return the new code."""
+    blank = code >> BLANK_SHIFT
+    shift = CELL_BITS * target
+    tile = (code >> shift) & CELL_MASK
+    return (code - (tile << shift) + (tile << (CELL_BITS * blank))
+            + ((target - blank) << BLANK_SHIFT))
+
+
+def rank_code(code: int) -> int:
+    """
+    Return the Lehmer-code rank of a code, equal to
+    ``oracle.rank(decode(code))`` but without building the tuple: a tile's
+    digit is the tile minus the number of smaller tiles in earlier cells.
+    """
+    r = 0
+    seen = 0  # Mask of the tiles in the cells so far
+    for pos in range(8):
+        tile = (code >> (CELL_BITS * pos)) & CELL_MASK
+        r += (tile - _POPCOUNT[seen & ((1 << tile) - 1)]) * _WEIGHTS[pos]
+        seen |= 1 << tile
+    return r
+
+
+def _rank_step(blank: int, target: int) -> Tuple[int, int, int, int, Tuple[Tuple[int, int], ...]]:
+    weight = _WEIGHTS[blank]
+    sign = 1 if target > blank else -1
+    low, high = min(blank, target), max(blank, target)
+    mids = tuple((CELL_BITS * pos, sign * (weight + _WEIGHTS[pos])) for pos in range(low + 1, high))
+    return weight - _WEIGHTS[target], _WEIGHTS[target], 9 - target, sign * weight, mids
+
+
+# For every blank, in TARGETS order: how a slide changes the rank, as
+# (digit factor, digit weight, digit radix, base change, ((mid shift, change), ...)).
+# Only the digits of the blank, the moved tile and the (at most two) tiles
+# between them change. The blank's digit is always 0, and the moved tile's
+# digit, read off the old rank, tells how many tiles after both cells are
+# smaller than the tile, which is all the update needs.
+RANK_STEPS = [tuple(_rank_step(blank, target) for target in targets)
+              for blank, targets in enumerate(TARGETS)]
+
+
+def slide_rank(r: int, code: int, target: int) -> int:
+    """Return ``rank_code(slide(code, target))`` given ``r = rank_code(code)``, in O(1)."""
+    blank = code >> BLANK_SHIFT
+    tile = (code >> (CELL_BITS * target)) & CELL_MASK
+    factor, weight, radix, change, mids = RANK_STEPS[blank][TARGETS[blank].index(target)]
+    r += factor * (r // weight % radix) + change
+    for shift, mid_change in mids:
+        if (code >> shift) & CELL_MASK < tile:
+            r += mid_change
+    return r
+
+
+def get_neighbors(code: int) -> List[int]:
+    """Return the codes of all states one move away."""
+    return [slide(code, target) for target in TARGETS[code >> BLANK_SHIFT]]
+
+
+def random_neighbor(code: int, rng=random) -> int:
+    """Return one neighbour drawn uniformly from the valid moves of the blank."""
+    return slide(code, rng.choice(TARGETS[code >> BLANK_SHIFT]))
+
+
+@lru_cache(maxsize=None)
+def manhattan_table(goal: Tuple[int, ...] = GOAL) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Return ``table[tile][cell]``, the distance from ``cell`` to the goal cell
+    of ``tile``; the blank's row is all zeros.
+    """
+    goal_pos = [0] * 9
+    for pos, tile in enumerate(goal):
+        goal_pos[tile] = pos
+    return tuple(tuple(0 if tile == 0 else CELL_DISTANCE[cell][goal_pos[tile]]
+                       for cell in range(9))
+                 for tile in range(9))
+
+
+def get_manhattan_distance(code: int, goal: Tuple[int, ...] = GOAL) -> int:
+    """Manhattan distance of a code; matches generator.get_manhattan_distance."""
+    table = manhattan_table(goal)
+    return sum(table[(code >> (CELL_BITS * cell)) & CELL_MASK][cell] for cell in range(9))
+
+
+class PackedEightPuzzle(Problem):
+    """
+    8-puzzle over int codes for the ``ai_berkeley.search`` algorithms.
+    Actions are target cells (see ``slide``); ``h`` is the Manhattan
+    distance. Goals default to the package's ``(0, 1, ..., 8)``.
+    """
+
+    def __init__(self, initial: int, goal: Tuple[int, ...] = GOAL):
+        super().__init__(initial, encode(goal))
+        self.goal_state = goal
+
+    def actions(self, state: int) -> Tuple[int, ...]:
+        return TARGETS[state >> BLANK_SHIFT]
+
+    def result(self, state: int, action: int) -> int:
+        return slide(state, action)
+
+    def goal_test(self, state: int) -> bool:
+        return state == self.goal
+
+    def h(self, node) -> int:
+        return get_manhattan_distance(node.state, self.goal_state)
+
+    def reverse(self) -> 'PackedEightPuzzle':
+        """The backward problem for ``bidirectional_search``: initial and goal swapped."""
+        return PackedEightPuzzle(self.goal, decode(self.initial))
@@ -0,0 +1,177 @@
+"""
+Additive disjoint pattern databases for the n x n sliding-tile puzzle.
+
+The tiles are split into disjoint groups. For each group a database stores,
+for every placement of the group's tiles, the least number of moves *of
+those tiles* needed to bring them home, with every other tile treated as
+indistinguishable. Because each move shifts a tile of only one group, the
+values of all groups can be added and the sum is still admissible.
+
+A database is built offline by a 0-1 breadth-first search over (placement,
+blank cell) pairs: moving a group tile costs 1, moving any other tile costs
+0. Placements are indexed by their partial-permutation rank, the table is
+stored as a ``uint8`` ``.npy`` file and memory-mapped when loaded.
+
+Build memory is one byte per (placement, blank cell) pair, so groups of up
+to 5-6 tiles build comfortably; 7-8 tile groups (the classic 15-puzzle
+split) need several hundred MB to a few GB.
+"""
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .oracle import DATA_DIR, UNREACHABLE
+from .sliding import goal_state, move_table
+
+
+def default_partition(n: int) -> List[Tuple[int, ...]]:
+    """
+    Split the tiles 1 .. n*n-1 into consecutive groups: 4-4 for the
+    8-puzzle, 5-5-5 for the 15-puzzle and 4-4-4-4-4-4 for the 24-puzzle.
+    """
+    size = {3: 4, 4: 5}.get(n, 4)
+    tiles = list(range(1, n * n))
+    return [tuple(tiles[i:i + size]) for i in range(0, len(tiles), size)]
+
+
+def _radices(num_cells: int, k: int) -> np.ndarray:
+    """Place values of the mixed-radix (N, N-1, ..., N-k+1) ranking."""
+    values = np.ones(k, dtype=np.int64)
+    for i in range(k - 2, -1, -1):
+        values[i] = values[i + 1] * (num_cells - i - 1)
+    return values
+
+
+def rank_placements(positions: np.ndarray, num_cells: int) -> np.ndarray:
+    """
+    Rank every row of an (m, k) array of distinct cells in
+    ``range(num_cells! / (num_cells - k)!)``.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    k = positions.shape[1]
+    radices = _radices(num_cells, k)
+    ranks = np.zeros(len(positions), dtype=np.int64)
+    for i in range(k):
+        digit = positions[:, i] - (positions[:, :i] < positions[:, i:i + 1]).sum(axis=1)
+        ranks += digit * radices[i]
+    return ranks
+
+
+def build_pattern_database(n: int, tiles: Sequence[int],
+                           goal: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+    """Build the database of one tile group by 0-1 BFS backwards from ``goal``."""
+    goal = goal or goal_state(n)
+    num_cells = n * n
+    k = len(tiles)
+    targets = move_table(n)
+    num_placements = int(np.prod(np.arange(num_cells - k + 1, num_cells + 1, dtype=np.int64)))
+    dist = np.full(num_placements * num_cells, UNREACHABLE, dtype=np.uint8)
+
+    def index(positions, blanks):
+        return rank_placements(positions, num_cells) * num_cells + blanks
+
+    positions = np.array([[goal.index(tile) for tile in tiles]], dtype=np.int64)
+    blanks = np.array([goal.index(0)], dtype=np.int64)
+    dist[index(positions, blanks)] = 0
+    depth = 0
+    while len(positions):
+        # Close the layer under free moves, collecting tile moves for the next
+        next_positions, next_blanks = [], []
+        while len(positions):
+            free_positions, free_blanks = [], []
+            for blank in range(num_cells):
+                rows = blanks == blank
+                if not rows.any():
+                    continue
+                layer = positions[rows]
+                for target in targets[blank]:
+                    occupied = layer == target
+                    moves_tile = occupied.any(axis=1)
+                    # A group tile slides into the blank: costs one move
+                    moved = layer[moves_tile].copy()
+                    moved[occupied[moves_tile]] = blank
+                    next_positions.append(moved)
+                    next_blanks.append(np.full(len(moved), target, dtype=np.int64))
+                    # Any other tile slides in: free
+                    free_positions.append(layer[~moves_tile])
+                    free_blanks.append(np.full(int((~moves_tile).sum()), target, dtype=np.int64))
+            positions = np.concatenate(free_positions)
+            blanks = np.concatenate(free_blanks)
+            indices = index(positions, blanks)
+            new = dist[indices] == UNREACHABLE
+            indices, first = np.unique(indices[new], return_index=True)
+            dist[indices] = depth
+            positions, blanks = positions[new][first], blanks[new][first]
+
+        depth += 1
+        positions = np.concatenate(next_positions)
+        blanks = np.concatenate(next_blanks)
+        indices = index(positions, blanks)
+        new = dist[indices] == UNREACHABLE
+        indices, first = np.unique(indices[new], return_index=True)
+        dist[indices] = depth
+        positions, blanks = positions[new][first], blanks[new][first]
+
+    # The blank's cell does not matter for the estimate
+    return dist.reshape(num_placements, num_cells).min(axis=1)
+
+
+def database_path(n: int, tiles: Sequence[int], goal: Optional[Tuple[int, ...]] = None,
+                  directory: Path = DATA_DIR) -> Path:
+    """Return where the database of one tile group is stored."""
+    goal = goal or goal_state(n)
+    goal_name = '-'.join(map(str, goal))
+    tile_name = '-'.join(map(str, tiles))
+    return Path(directory) / f"sliding{n}_pdb_{tile_name}_goal_{goal_name}.npy"
+
+
+def load_pattern_database(n: int, tiles: Sequence[int], goal: Optional[Tuple[int, ...]] = None,
+                          directory: Path = DATA_DIR) -> np.ndarray:
+    """
+    Memory-map the database of one tile group, building and saving it first
+    if the file does not exist yet.
+    """
+    path = database_path(n, tiles, goal, directory)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, build_pattern_database(n, tiles, goal))
+    return np.load(path, mmap_mode='r')
+
+
+class PatternDatabaseHeuristic:
+    """
+    Admissible heuristic summing the disjoint pattern databases of a
+    partition of the tiles. Callable on a state tuple, so it plugs into
+    ``SlidingPuzzle`` (A*) and the IDA* solver alike.
+    """
+
+    def __init__(self, n: int, partition: Optional[Sequence[Sequence[int]]] = None,
+                 goal: Optional[Tuple[int, ...]] = None, directory: Path = DATA_DIR):
+        self.n = n
+        self.goal = goal or goal_state(n)
+        self.partition = [tuple(group) for group in (partition or default_partition(n))]
+        tiles = [tile for group in self.partition for tile in group]
+        if len(set(tiles)) != len(tiles) or 0 in tiles:
+            raise ValueError("Pattern groups must be disjoint and must not contain the blank")
+        self.tables = [load_pattern_database(n, group, self.goal, directory)
+                       for group in self.partition]
+        num_cells = n * n
+        self._radices = [_radices(num_cells, len(group)).tolist() for group in self.partition]
+
+    def __call__(self, state: Tuple[int, ...]) -> int:
+        where = [0] * len(state)
+        for pos, tile in enumerate(state):
+            where[tile] = pos
+        total = 0
+        for group, radices, table in zip(self.partition, self._radices, self.tables):
+            rank = 0
+            for i, tile in enumerate(group):
+                pos = where[tile]
+                digit = pos
+                for earlier in group[:i]:
+                    if where[earlier] < pos:
+                        digit -= 1
+                rank += digit * radices[i]
+            total += int(table[rank])
+        return total
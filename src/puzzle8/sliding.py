@@ -0,0 +1,146 @@
+"""
+N x N sliding-tile puzzle (8-, 15-, 24-puzzle, ...).
+
+States are tuples of length ``n * n`` with 0 for the blank, indexed row by
+row, exactly like the 8-puzzle states elsewhere in the package. The default
+goal is ``(0, 1, ..., n*n - 1)``. A move is identified by the target cell
+whose tile slides into the blank.
+"""
+import random
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+from ..ai_berkeley.search import Problem
+
+
+def goal_state(n: int) -> Tuple[int, ...]:
+    """Return the default goal of the n x n puzzle."""
+    return tuple(range(n * n))
+
+
+@lru_cache(maxsize=None)
+def move_table(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Return the target cells reachable from every blank position, in the order
+    up, down, left, right (as ``puzzle8.board.MOVE_TABLE``).
+    """
+    table = []
+    for blank in range(n * n):
+        row, col = divmod(blank, n)
+        targets = []
+        if row > 0:
+            targets.append(blank - n)
+        if row < n - 1:
+            targets.append(blank + n)
+        if col > 0:
+            targets.append(blank - 1)
+        if col < n - 1:
+            targets.append(blank + 1)
+        table.append(tuple(targets))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def cell_distance(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """Manhattan distance between every pair of cells of the n x n grid."""
+    return tuple(tuple(abs(p // n - q // n) + abs(p % n - q % n) for q in range(n * n))
+                 for p in range(n * n))
+
+
+def slide(state: Tuple[int, ...], blank: int, target: int) -> Tuple[int, ...]:
+    """Slide the tile at ``target`` into ``blank`` and return the new state."""
+    tiles = list(state)
+    tiles[blank], tiles[target] = tiles[target], 0
+    return tuple(tiles)
+
+
+def get_neighbors(state: Tuple[int, ...], n: int) -> List[Tuple[int, ...]]:
+    """Return all states one move away."""
+    blank = state.index(0)
+    return [slide(state, blank, target) for target in move_table(n)[blank]]
+
+
+def is_solvable(state: Tuple[int, ...], n: int, goal: Optional[Tuple[int, ...]] = None) -> bool:
+    """
+    Check whether ``state`` can reach ``goal``. Every move is a transposition
+    that also moves the blank one cell, so the permutation taking goal to
+    state must have the same parity as the blank's Manhattan displacement.
+    """
+    goal = goal or goal_state(n)
+    goal_pos = {tile: pos for pos, tile in enumerate(goal)}
+    perm = [goal_pos[tile] for tile in state]
+    seen = [False] * len(perm)
+    transpositions = 0
+    for start in range(len(perm)):
+        length = 0
+        pos = start
+        while not seen[pos]:
+            seen[pos] = True
+            pos = perm[pos]
+            length += 1
+        if length:
+            transpositions += length - 1
+    blank_distance = cell_distance(n)[state.index(0)][goal.index(0)]
+    return transpositions % 2 == blank_distance % 2
+
+
+def random_instance(n: int, rng=random, goal: Optional[Tuple[int, ...]] = None) -> Tuple[int, ...]:
+    """Return a uniformly random solvable state of the n x n puzzle."""
+    goal = goal or goal_state(n)
+    tiles = list(goal)
+    rng.shuffle(tiles)
+    if not is_solvable(tuple(tiles), n, goal):
+        # Swapping two tiles flips the permutation parity
+        i, j = [pos for pos, tile in enumerate(tiles) if tile != 0][:2]
+        tiles[i], tiles[j] = tiles[j], tiles[i]
+    return tuple(tiles)
+
+
+def get_manhattan_distance(state: Tuple[int, ...], n: int,
+                           goal: Optional[Tuple[int, ...]] = None) -> int:
+    """Sum of the Manhattan distances of all tiles to their goal cells."""
+    goal = goal or goal_state(n)
+    goal_pos = {tile: pos for pos, tile in enumerate(goal)}
+    distance = cell_distance(n)
+    return sum(distance[pos][goal_pos[tile]] for pos, tile in enumerate(state) if tile != 0)
+
+
+class SlidingPuzzle(Problem):
+    """
+    The n x n sliding-tile puzzle for the ``ai_berkeley.search`` algorithms.
+    Actions are target cells. ``heuristic`` maps a state to an admissible
+    estimate (e.g. a ``PatternDatabaseHeuristic``); it defaults to the
+    Manhattan distance.
+    """
+
+    def __init__(self, initial: Tuple[int, ...], n: int,
+                 goal: Optional[Tuple[int, ...]] = None,
+                 heuristic: Optional[Callable[[Tuple[int, ...]], int]] = None):
+        goal = goal or goal_state(n)
+        super().__init__(initial, goal)
+        self.n = n
+        self.custom_heuristic = heuristic is not None
+        self.heuristic = heuristic or (lambda state: get_manhattan_distance(state, n, goal))
+
+    def actions(self, state: Tuple[int, ...]) -> Tuple[int, ...]:
+        return move_table(self.n)[state.index(0)]
+
+    def result(self, state: Tuple[int, ...], action: int) -> Tuple[int, ...]:
+        return slide(state, state.index(0), action)
+
+    def goal_test(self, state: Tuple[int, ...]) -> bool:
+        return state == self.goal
+
+    def h(self, node) -> int:
+        return self.heuristic(node.state)
+
+    def reverse(self) -> 'SlidingPuzzle':
+        """
+        The backward problem for ``bidirectional_search``: initial and goal
+        swapped, with the Manhattan distance to the old initial state. A
+        custom heuristic is tied to its goal, so it cannot be carried over.
+        """
+        if self.custom_heuristic:
+            raise ValueError("A custom heuristic estimates the distance to this goal "
+                             "only; pass a reverse_problem")
+        return SlidingPuzzle(self.goal, self.n, self.initial)
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from .board import GOAL, IncrementalManhattan, PuzzleMoves
+from .generator import apply_move, generate_8puzzle_instance, get_manhattan_distance, get_valid_moves
+
+
+class TestPuzzleMoves(unittest.TestCase):
+    def test_moves_match_neighbors(self):
+        rng = random.Random(0)
+        problem = PuzzleMoves()
+        for _ in range(50):
+            state = tuple(rng.sample(range(9), 9))
+            problem.reset(state)
+            neighbors = []
+            for move in problem.moves():
+                problem.apply(move)
+                neighbors.append(problem.state())
+                problem.undo(move)
+            expected = [apply_move(state, m) for m in get_valid_moves(state.index(0))]
+            self.assertEqual(neighbors, expected)
+            self.assertEqual(problem.state(), state)
+
+    def test_delta_apply_undo(self):
+        """delta is the change in -get_manhattan_distance; undo restores the state."""
+        rng = random.Random(1)
+        for goal in (GOAL, (1, 2, 3, 4, 5, 6, 7, 8, 0)):
+            problem = PuzzleMoves(goal)
+            problem.reset(tuple(rng.sample(range(9), 9)))
+            applied = []
+            for _ in range(300):
+                before = problem.state()
+                move = problem.random_move(rng)
+                delta = problem.delta(move)
+                problem.apply(move)
+                after = problem.state()
+                self.assertEqual(delta, get_manhattan_distance(before, goal)
+                                 - get_manhattan_distance(after, goal))
+                self.assertEqual(after.index(0), problem.blank)
+                applied.append((move, before))
+            for move, before in reversed(applied):
+                problem.undo(move)
+                self.assertEqual(problem.state(), before)
+
+
+class TestIncrementalManhattan(unittest.TestCase):
+    def test_matches_full_distance(self):
+        """Agrees with get_manhattan_distance on slides and on unrelated states."""
+        rng = random.Random(2)
+        distance = IncrementalManhattan()
+        state = generate_8puzzle_instance()
+        for _ in range(500):
+            if rng.random() < 0.2:
+                state = tuple(rng.sample(range(9), 9))
+            else:
+                state = apply_move(state, rng.choice(get_valid_moves(state.index(0))))
+            self.assertEqual(distance(state), get_manhattan_distance(state))
+
+
+if __name__ == '__main__':
+    unittest.main()
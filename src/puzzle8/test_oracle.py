@@ -0,0 +1,68 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..ai_berkeley.search import astar_search
+from .board import GOAL
+from .oracle import DistanceOracle, rank, unrank
+from .sliding import SlidingPuzzle, get_neighbors, is_solvable, random_instance
+
+
+class TestDistanceOracle(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the distance table once, in a scratch directory."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.oracle = DistanceOracle(path=Path(cls.directory.name) / 'distances.npy')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_rank_round_trip(self):
+        """unrank inverts rank."""
+        rng = random.Random(0)
+        for _ in range(200):
+            state = tuple(rng.sample(range(9), 9))
+            self.assertEqual(unrank(rank(state)), state)
+
+    def test_distance_matches_astar(self):
+        """Oracle distances equal the optimal A* solution lengths."""
+        rng = random.Random(1)
+        for _ in range(30):
+            state = random_instance(3, rng)
+            solution = astar_search(SlidingPuzzle(state, 3))
+            self.assertEqual(self.oracle.distance(state), solution.path_cost)
+
+    def test_neighbors_differ_by_one(self):
+        """Distances are consistent: neighbours differ by exactly one move."""
+        rng = random.Random(2)
+        for _ in range(100):
+            state = random_instance(3, rng)
+            d = self.oracle(state)
+            for neighbor in get_neighbors(state, 3):
+                self.assertEqual(abs(self.oracle(neighbor) - d), 1)
+
+    def test_solve_returns_optimal_path(self):
+        """solve walks legal moves from the state to the goal in distance moves."""
+        rng = random.Random(3)
+        for _ in range(20):
+            state = random_instance(3, rng)
+            path = self.oracle.solve(state)
+            self.assertEqual(path[0], state)
+            self.assertEqual(path[-1], GOAL)
+            self.assertEqual(len(path) - 1, self.oracle.distance(state))
+            for before, after in zip(path, path[1:]):
+                self.assertIn(after, get_neighbors(before, 3))
+
+    def test_unsolvable_state_raises(self):
+        """States of the other parity class cannot reach the goal."""
+        state = (0, 2, 1, 3, 4, 5, 6, 7, 8)
+        self.assertFalse(is_solvable(state, 3))
+        with self.assertRaises(ValueError):
+            self.oracle.distance(state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import random
+import unittest
+
+from .board import GOAL
+from .generator import apply_move, get_manhattan_distance, get_valid_moves
+from .oracle import rank
+from .packed import (PackedEightPuzzle, blank_of, decode, encode, get_neighbors,
+                     get_manhattan_distance as packed_manhattan, random_neighbor, rank_code,
+                     slide, slide_rank)
+
+
+class TestPacked(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.states = [tuple(rng.sample(range(9), 9)) for _ in range(300)] + [GOAL]
+
+    def test_round_trip(self):
+        """decode(encode(s)) is s, and distinct states get distinct codes."""
+        codes = set()
+        for state in itertools.islice(itertools.permutations(range(9)), 0, None, 97):
+            code = encode(state)
+            self.assertEqual(decode(code), state)
+            self.assertEqual(blank_of(code), state.index(0))
+            codes.add(code)
+        self.assertEqual(len(codes), len(range(0, 362880, 97)))
+
+    def test_neighbors_match_tuple_moves(self):
+        """Sliding codes visits the same states as apply_move on tuples."""
+        for state in self.states:
+            expected = [apply_move(state, move) for move in get_valid_moves(state.index(0))]
+            self.assertEqual(sorted(decode(code) for code in get_neighbors(encode(state))),
+                             sorted(expected))
+
+    def test_slide_walk(self):
+        """A long random walk on codes stays in step with the tuple walk."""
+        rng = random.Random(1)
+        code, state = encode(GOAL), GOAL
+        for _ in range(2000):
+            move = rng.choice(get_valid_moves(state.index(0)))
+            state = apply_move(state, move)
+            previous, code = code, slide(code, state.index(0))
+            self.assertEqual(code, encode(state))
+            self.assertEqual(packed_manhattan(code), get_manhattan_distance(state))
+            # Sliding the tile back restores the previous code
+            self.assertEqual(slide(code, blank_of(previous)), previous)
+        for _ in range(200):
+            neighbor = random_neighbor(code, rng)
+            self.assertIn(neighbor, get_neighbors(code))
+
+    def test_ranks(self):
+        """rank_code matches oracle.rank, and slide_rank follows every slide."""
+        for state in itertools.islice(itertools.permutations(range(9)), 0, None, 31):
+            code = encode(state)
+            r = rank_code(code)
+            self.assertEqual(r, rank(state))
+            for neighbor in get_neighbors(code):
+                self.assertEqual(slide_rank(r, code, blank_of(neighbor)), rank(decode(neighbor)))
+
+    def test_manhattan_other_goal(self):
+        goal = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+        for state in self.states:
+            self.assertEqual(packed_manhattan(encode(state), goal), get_manhattan_distance(state, goal))
+
+    def test_problem(self):
+        problem = PackedEightPuzzle(encode(self.states[0]))
+        self.assertEqual(problem.goal, encode(GOAL))
+        self.assertTrue(problem.goal_test(encode(GOAL)))
+        for action in problem.actions(problem.initial):
+            self.assertIn(problem.result(problem.initial, action), get_neighbors(problem.initial))
+
+
+if __name__ == '__main__':
+    unittest.main()
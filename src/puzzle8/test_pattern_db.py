@@ -0,0 +1,55 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..ai_berkeley.search import astar_search
+from .oracle import DistanceOracle
+from .pattern_db import PatternDatabaseHeuristic
+from .sliding import SlidingPuzzle, get_manhattan_distance, random_instance
+
+
+class TestPatternDatabaseHeuristic(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the 8-puzzle databases and the oracle in a scratch directory."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.oracle = DistanceOracle(path=Path(cls.directory.name) / 'distances.npy')
+        cls.full = PatternDatabaseHeuristic(3, [tuple(range(1, 9))], directory=cls.directory.name)
+        cls.split = PatternDatabaseHeuristic(3, directory=cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_single_group_matches_oracle(self):
+        """A database of all eight tiles is the exact distance."""
+        rng = random.Random(0)
+        for _ in range(500):
+            state = random_instance(3, rng)
+            self.assertEqual(self.full(state), self.oracle(state))
+
+    def test_split_is_admissible_and_dominates_manhattan(self):
+        """The default 4-4 split lies between Manhattan distance and the exact distance."""
+        rng = random.Random(1)
+        for _ in range(500):
+            state = random_instance(3, rng)
+            h = self.split(state)
+            self.assertLessEqual(h, self.oracle(state))
+            self.assertGreaterEqual(h, get_manhattan_distance(state, 3))
+
+    def test_astar_stays_optimal(self):
+        """A* with the split databases finds optimal solutions."""
+        rng = random.Random(2)
+        for _ in range(20):
+            state = random_instance(3, rng)
+            solution = astar_search(SlidingPuzzle(state, 3, heuristic=self.split))
+            self.assertEqual(solution.path_cost, self.oracle(state))
+
+    def test_overlapping_groups_rejected(self):
+        with self.assertRaises(ValueError):
+            PatternDatabaseHeuristic(3, [(1, 2), (2, 3)], directory=self.directory.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
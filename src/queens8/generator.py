@@ -1,5 +1,6 @@
 import random
-from typing import List, Tuple
+import numpy as np
+from typing import List, Optional, Tuple
 
 def generate_8queens_state() -> Tuple[int, ...]:
     """
@@ -25,6 +26,58 @@ def count_conflicts(state: Tuple[int, ...]) -> int:
                 conflicts += 1
     return conflicts
 
+def count_conflicts_batch(boards: np.ndarray) -> np.ndarray:
+    """
+    Count the conflicts of m boards at once.
+    Takes an (m, n) integer array (one state per row) and returns the m
+    conflict counts, matching count_conflicts for each row. Row, diagonal and
+    anti-diagonal occupancies of all boards are counted with one bincount per
+    line family; k queens on one line contribute k * (k - 1) / 2 pairs.
+    """
+    boards = np.asarray(boards, dtype=np.int64)
+    if boards.ndim != 2:
+        raise ValueError(f"Expected an (m, n) array of boards, got shape {boards.shape}")
+    m, n = boards.shape
+    cols = np.arange(n)
+    conflicts = np.zeros(m, dtype=np.int64)
+    for lines, num_lines in ((boards, n),
+                             (boards - cols + n - 1, 2 * n - 1),
+                             (boards + cols, 2 * n - 1)):
+        # Offset each board's line ids so a single bincount covers the batch
+        ids = lines + (np.arange(m) * num_lines)[:, None]
+        counts = np.bincount(ids.ravel(), minlength=m * num_lines).reshape(m, num_lines)
+        conflicts += (counts * (counts - 1) // 2).sum(axis=1)
+    return conflicts
+
+def conflict_matrix(state: Tuple[int, ...]) -> np.ndarray:
+    """
+    Return the n x n matrix whose entry [r, c] is the number of conflicts
+    after moving the queen in column c to row r (entry [state[c], c] is the
+    current count). Evaluates the whole neighborhood in one vectorized pass.
+    """
+    rows = np.asarray(state, dtype=np.int64)
+    n = len(rows)
+    cols = np.arange(n)
+    row_counts = np.bincount(rows, minlength=n)
+    diag_counts = np.bincount(rows - cols + n - 1, minlength=2 * n - 1)
+    anti_counts = np.bincount(rows + cols, minlength=2 * n - 1)
+    current = int((row_counts * (row_counts - 1) // 2).sum()
+                  + (diag_counts * (diag_counts - 1) // 2).sum()
+                  + (anti_counts * (anti_counts - 1) // 2).sum())
+
+    # Queens attacking each queen in its current square
+    attacks = (row_counts[rows] + diag_counts[rows - cols + n - 1]
+               + anti_counts[rows + cols] - 3)
+    # Queens on the lines through every square; a moved queen never shares
+    # a line with its old square, so these need no correction
+    r = cols[:, None]
+    c = cols[None, :]
+    gained = row_counts[r] + diag_counts[r - c + n - 1] + anti_counts[r + c]
+
+    matrix = current - attacks[None, :] + gained
+    matrix[rows, cols] = current
+    return matrix
+
 def get_neighbors(state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
     """
     Generate all possible neighbor states by moving one queen to a different row in its column.
@@ -38,6 +91,23 @@ def get_neighbors(state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
                 neighbors.append(tuple(new_state))
     return neighbors
 
+def random_neighbor(state: Tuple[int, ...], rng=random) -> Optional[Tuple[int, ...]]:
+    """
+    Return one neighbor drawn uniformly from get_neighbors(state) without
+    enumerating the neighborhood: a random queen moves to a random other row.
+    Returns None if the state has no neighbors (boards smaller than 2x2).
+    """
+    n = len(state)
+    if n < 2:
+        return None
+    col = rng.randrange(n)
+    row = rng.randrange(n - 1)
+    if row >= state[col]:  # Skip the queen's current row
+        row += 1
+    new_state = list(state)
+    new_state[col] = row
+    return tuple(new_state)
+
 def print_board(state: Tuple[int, ...]) -> None:
     """
     Print the chess board with queens placed according to the state.
@@ -0,0 +1,185 @@
+"""
+Min-conflicts local search for large N-Queens instances (N up to 10^6).
+
+The board is a permutation held in an ``array`` (one queen per row and per
+column), so only diagonal attacks can occur. Diagonal occupancy counters make
+every conflict check and every swap O(1), and a list of possibly attacked
+columns tells the repair loop where to work, so a repair step costs O(1)
+amortized. Memory use is about 12 bytes per queen: 4 for the row of each
+column plus two 2-byte counters per diagonal family.
+"""
+import random
+from array import array
+from typing import Any, Dict, List, Tuple
+
+# Candidate rows tried per column by the greedy initial placement before it
+# settles for a conflicting one.
+GREEDY_ATTEMPTS = 20
+
+# Swap attempts without an improvement after which the board is considered
+# stuck in a local minimum and is placed again from scratch.
+STALL_STEPS = 1000
+
+
+class MinConflictsQueens:
+    """
+    N-Queens board for min-conflicts search.
+
+    ``rows[col]`` is the row of the queen in column ``col``, as in the rest of
+    the package. ``conflicts`` is the number of attacking pairs and always
+    equals ``count_conflicts(tuple(rows))``.
+    """
+
+    def __init__(self, n: int, rng=random):
+        if n < 1:
+            raise ValueError(f"Board size must be positive, got {n}")
+        self.n = n
+        self.rng = rng
+        self.rows = array('i', range(n))
+        self.diag_counts = array('H', bytes(2 * (2 * n - 1)))  # row - col + n - 1
+        self.anti_counts = array('H', bytes(2 * (2 * n - 1)))  # row + col
+        self.conflicts = 0
+        self.conflicted: List[int] = []
+        self._greedy_placement()
+
+    def _greedy_placement(self) -> None:
+        """
+        Fill the columns left to right, swapping in a random unused row that
+        no earlier queen attacks (up to GREEDY_ATTEMPTS tries per column).
+        Leaves only a handful of conflicts, all recorded in ``conflicted``.
+        """
+        n = self.n
+        rows = self.rows
+        diag = self.diag_counts
+        anti = self.anti_counts
+        for i in range(2 * n - 1):
+            diag[i] = anti[i] = 0
+        self.conflicts = 0
+        self.conflicted = []
+        randrange = self.rng.randrange
+        for col in range(n):
+            for _ in range(GREEDY_ATTEMPTS):
+                j = col + randrange(n - col)
+                row = rows[j]
+                if diag[row - col + n - 1] == 0 and anti[row + col] == 0:
+                    break
+            rows[col], rows[j] = row, rows[col]
+            d = diag[row - col + n - 1]
+            a = anti[row + col]
+            if d or a:
+                self.conflicts += d + a
+                self.conflicted.append(col)
+            diag[row - col + n - 1] = d + 1
+            anti[row + col] = a + 1
+
+    def attacked(self, col: int) -> bool:
+        """Return True if another queen shares a diagonal with the one in ``col``."""
+        row = self.rows[col]
+        return self.diag_counts[row - col + self.n - 1] > 1 or self.anti_counts[row + col] > 1
+
+    def _lift(self, col: int, row: int) -> None:
+        d = row - col + self.n - 1
+        a = row + col
+        self.diag_counts[d] -= 1
+        self.anti_counts[a] -= 1
+        self.conflicts -= self.diag_counts[d] + self.anti_counts[a]
+
+    def _drop(self, col: int, row: int) -> None:
+        d = row - col + self.n - 1
+        a = row + col
+        self.conflicts += self.diag_counts[d] + self.anti_counts[a]
+        self.diag_counts[d] += 1
+        self.anti_counts[a] += 1
+
+    def swap(self, i: int, j: int) -> None:
+        """Exchange the rows of the queens in columns ``i`` and ``j``."""
+        rows = self.rows
+        ri, rj = rows[i], rows[j]
+        self._lift(i, ri)
+        self._lift(j, rj)
+        self._drop(i, rj)
+        self._drop(j, ri)
+        rows[i], rows[j] = rj, ri
+
+    def _rebuild_conflicted(self) -> None:
+        """Rescan every column; only needed if the list ever runs dry early."""
+        self.conflicted = [col for col in range(self.n) if self.attacked(col)]
+
+    def solve(self, max_steps: int = 0) -> Tuple[bool, int]:
+        """
+        Repair conflicts until the board is solved or ``max_steps`` swap
+        attempts were made (0 means no limit).
+
+        Each step takes an attacked column from the conflict list and swaps
+        its queen with a random column when that lowers the conflict count.
+        The list only ever needs the columns touched by accepted swaps: every
+        new attacking pair involves one of them. After STALL_STEPS attempts
+        without an improvement the board is placed again. Returns whether
+        the board is solved and the number of steps taken.
+        """
+        n = self.n
+        if n in (2, 3) and not max_steps:
+            raise ValueError(f"{n}-Queens has no solution; pass max_steps to bound the search")
+        randrange = self.rng.randrange
+        conflicted = self.conflicted
+        steps = 0
+        stalled = 0
+        while self.conflicts:
+            if not conflicted:
+                self._rebuild_conflicted()
+                conflicted = self.conflicted
+            if max_steps and steps >= max_steps:
+                break
+            if stalled >= STALL_STEPS:
+                self._greedy_placement()
+                conflicted = self.conflicted
+                stalled = 0
+                continue
+            # Work on a random listed column; drop it if no longer attacked
+            k = randrange(len(conflicted))
+            col = conflicted[k]
+            if not self.attacked(col):
+                conflicted[k] = conflicted[-1]
+                conflicted.pop()
+                continue
+
+            steps += 1
+            stalled += 1
+            other = randrange(n)
+            if other == col:
+                continue
+            before = self.conflicts
+            self.swap(col, other)
+            if self.conflicts < before:
+                stalled = 0
+                if self.attacked(other):
+                    conflicted.append(other)
+            else:
+                self.swap(col, other)
+        return self.conflicts == 0, steps
+
+    def state(self) -> Tuple[int, ...]:
+        """Return the board as a state tuple (O(n) copy)."""
+        return tuple(self.rows)
+
+    def memory_bytes(self) -> int:
+        """Return the bytes held by the state and counter arrays."""
+        return sum(buf.itemsize * len(buf)
+                   for buf in (self.rows, self.diag_counts, self.anti_counts))
+
+
+def min_conflicts_queens(n: int, max_steps: int = 0, rng=random) -> Tuple[MinConflictsQueens, Dict[str, Any]]:
+    """
+    Solve N-Queens with greedy placement followed by min-conflicts repair.
+    Returns the board and run statistics (initial/final conflicts, steps,
+    whether a solution was found).
+    """
+    board = MinConflictsQueens(n, rng)
+    initial_conflicts = board.conflicts
+    solved, steps = board.solve(max_steps)
+    return board, {
+        'Initial Conflicts': initial_conflicts,
+        'Final Conflicts': board.conflicts,
+        'Steps': steps,
+        'Solution Found': solved
+    }
@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from .board import IncrementalConflictCounter, QueensBoard, QueensMoves
+from .generator import count_conflicts, get_neighbors
+
+
+def random_state(rng, n):
+    return tuple(rng.randrange(n) for _ in range(n))
+
+
+class TestQueensBoard(unittest.TestCase):
+    def test_conflicts_follow_moves(self):
+        """conflicts equals count_conflicts(state()) after any sequence of moves."""
+        rng = random.Random(0)
+        for n in (1, 2, 4, 8, 13):
+            board = QueensBoard(random_state(rng, n))
+            self.assertEqual(board.conflicts, count_conflicts(board.state()))
+            for _ in range(200):
+                col, row = rng.randrange(n), rng.randrange(n)
+                old_row = board.rows[col]
+                self.assertEqual(board.move(col, row), old_row)
+                self.assertEqual(board.conflicts, count_conflicts(board.state()))
+
+    def test_delta_matches_count(self):
+        """delta predicts the change in conflicts without touching the board."""
+        rng = random.Random(1)
+        for n in (4, 8, 11):
+            for _ in range(30):
+                state = random_state(rng, n)
+                board = QueensBoard(state)
+                for col in range(n):
+                    for row in range(n):
+                        moved = list(state)
+                        moved[col] = row
+                        self.assertEqual(board.delta(col, row),
+                                         count_conflicts(tuple(moved)) - count_conflicts(state))
+                self.assertEqual(board.state(), state)
+
+    def test_attacks(self):
+        board = QueensBoard((0, 1, 2, 3))
+        self.assertEqual([board.attacks(col) for col in range(4)], [3, 3, 3, 3])
+        board = QueensBoard((1, 3, 0, 2))
+        self.assertEqual([board.attacks(col) for col in range(4)], [0, 0, 0, 0])
+
+
+class TestIncrementalConflictCounter(unittest.TestCase):
+    def test_matches_count_conflicts(self):
+        """Agrees with count_conflicts on neighbours, unrelated states and size changes."""
+        rng = random.Random(2)
+        counter = IncrementalConflictCounter()
+        state = random_state(rng, 8)
+        for _ in range(500):
+            if rng.random() < 0.2:
+                state = random_state(rng, rng.choice((6, 8)))
+            else:
+                moved = list(state)
+                moved[rng.randrange(len(state))] = rng.randrange(len(state))
+                state = tuple(moved)
+            self.assertEqual(counter(state), count_conflicts(state))
+
+
+class TestQueensMoves(unittest.TestCase):
+    def test_moves_match_get_neighbors(self):
+        rng = random.Random(3)
+        problem = QueensMoves()
+        for n in (1, 2, 5, 8):
+            state = random_state(rng, n)
+            problem.reset(state)
+            neighbors = []
+            for move in problem.moves():
+                problem.apply(move)
+                neighbors.append(problem.state())
+                problem.undo(move)
+            self.assertEqual(sorted(neighbors), sorted(get_neighbors(state)))
+            self.assertEqual(problem.state(), state)
+
+    def test_delta_apply_undo(self):
+        """delta is the change in -count_conflicts; undo restores the state."""
+        rng = random.Random(4)
+        problem = QueensMoves()
+        problem.reset(random_state(rng, 8))
+        applied = []
+        for _ in range(300):
+            before = problem.state()
+            move = problem.random_move(rng)
+            delta = problem.delta(move)
+            problem.apply(move)
+            after = problem.state()
+            self.assertNotEqual(after, before)
+            self.assertEqual(delta, count_conflicts(before) - count_conflicts(after))
+            self.assertEqual(problem.board.conflicts, count_conflicts(after))
+            applied.append((move, before))
+        # Undo in reverse order walks back through every earlier state
+        for move, before in reversed(applied):
+            problem.undo(move)
+            self.assertEqual(problem.state(), before)
+
+    def test_best_move_matches_scan(self):
+        """best_move returns a move of maximum delta, found by brute force."""
+        rng = random.Random(5)
+        problem = QueensMoves()
+        for n in (2, 4, 8, 12):
+            for _ in range(25):
+                problem.reset(random_state(rng, n))
+                move, delta = problem.best_move(rng)
+                best = max(problem.delta(m) for m in problem.moves())
+                self.assertEqual(delta, best)
+                self.assertEqual(problem.delta(move), best)
+                self.assertIn(move, list(problem.moves()))
+        problem.reset((0,))
+        self.assertIsNone(problem.best_move(rng))
+        self.assertIsNone(problem.random_move(rng))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from .generator import count_conflicts
+from .min_conflicts import MinConflictsQueens, min_conflicts_queens
+
+
+class TestMinConflictsQueens(unittest.TestCase):
+    def test_solves_large_boards(self):
+        """The returned board is a permutation without a single attacking pair."""
+        for n in (1, 4, 50, 1000):
+            board, stats = min_conflicts_queens(n, rng=random.Random(n))
+            state = board.state()
+            self.assertTrue(stats['Solution Found'])
+            self.assertEqual(stats['Final Conflicts'], 0)
+            self.assertEqual(sorted(state), list(range(n)))
+            self.assertEqual(count_conflicts(state), 0)
+
+    def test_conflicts_follow_swaps(self):
+        """conflicts equals count_conflicts after placement and any swap."""
+        rng = random.Random(0)
+        for n in (5, 8, 40):
+            board = MinConflictsQueens(n, rng)
+            self.assertEqual(board.conflicts, count_conflicts(board.state()))
+            for _ in range(200):
+                board.swap(*rng.sample(range(n), 2))
+                self.assertEqual(board.conflicts, count_conflicts(board.state()))
+            for col in range(n):
+                self.assertEqual(board.attacked(col), any(
+                    abs(board.rows[col] - board.rows[other]) == abs(col - other)
+                    for other in range(n) if other != col))
+
+    def test_unsolvable_sizes(self):
+        with self.assertRaises(ValueError):
+            min_conflicts_queens(3)
+        board, stats = min_conflicts_queens(3, max_steps=50, rng=random.Random(1))
+        self.assertFalse(stats['Solution Found'])
+        self.assertEqual(stats['Steps'], 50)
+        self.assertEqual(board.conflicts, count_conflicts(board.state()))
+        with self.assertRaises(ValueError):
+            MinConflictsQueens(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
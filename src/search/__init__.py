@@ -4,5 +4,7 @@ Contains implementations of A* search and other search algorithms.
 """
 
 from .astar_search import astar_search, PuzzleState, generate_solvable_puzzle
+from .ida_star import ida_star_search, ManhattanHeuristic, LinearConflictHeuristic
 
-__all__ = ['astar_search', 'PuzzleState', 'generate_solvable_puzzle'] 
\ No newline at end of file
+__all__ = ['astar_search', 'PuzzleState', 'generate_solvable_puzzle',
+           'ida_star_search', 'ManhattanHeuristic', 'LinearConflictHeuristic'] 
\ No newline at end of file
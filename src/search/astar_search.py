@@ -1,8 +1,43 @@
+"""
+A* for the 8-puzzle on a struct-of-arrays node pool.
+
+Search nodes are not objects: node ``i`` is row ``i`` of a few typed arrays
+(packed state code, parent index, action code, path cost), 15 bytes per
+generated node, plus one byte for its heuristic value and four for its
+permutation rank. The best known cost of every state sits in a fixed
+9!-byte table indexed by that rank instead of a dict, so the heap entry is
+the largest per-node cost left; tracemalloc puts a search of the hardest
+(31-move) instances at about 46 bytes per generated node, and the table's
+363 KB dominates small searches. States use the packed-int codec of
+``puzzle8.packed``; the heuristic and the rank are updated incrementally per
+move and the solution path is rebuilt by walking parent indices.
+"""
+from array import array
 from heapq import heappush, heappop
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+
+from ..ai_berkeley.utils import BucketQueue
+from ..local_search.budget import Budget
+from ..puzzle8.board import GOAL, manhattan_delta_table
+from ..puzzle8.oracle import NUM_PERMUTATIONS
+from ..puzzle8.packed import (BLANK_SHIFT, CELL_BITS, CELL_MASK, TARGETS, decode, encode,
+                              RANK_STEPS, get_manhattan_distance, rank_code)
+
+ACTIONS = ('up', 'down', 'left', 'right')
+# Action code of a move, keyed by target - blank
+_ACTION_CODES = {-3: 0, 3: 1, -1: 2, 1: 3}
+NO_PARENT = -1
+# Heap entries are f << INDEX_BITS | node index
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+# best_g entry of a state no path has reached yet
+UNSEEN = 255
+
 
 class PuzzleState:
+    __slots__ = ('board', 'parent', 'action', 'path_cost', 'blank_pos')
+
     def __init__(self, board: List[int], parent=None, action=None, path_cost=0):
         self.board = board
         self.parent = parent
@@ -54,38 +89,183 @@ class PuzzleState:
             current = current.parent
         return list(reversed(actions))
 
-def astar_search(initial_state: PuzzleState) -> Optional[PuzzleState]:
-    """A* search algorithm."""
-    frontier = []  # Priority queue
-    explored = set()
-    
-    # Add initial state to frontier
-    heappush(frontier, (initial_state.manhattan_distance(), id(initial_state), initial_state))
-    
+
+class NodePool:
+    """
+    Search nodes stored column-wise in typed arrays; a node is its index.
+    The root has parent ``NO_PARENT`` and action code -1.
+    """
+    __slots__ = ('codes', 'parents', 'actions', 'costs')
+
+    def __init__(self):
+        self.codes = array('q')
+        self.parents = array('i')
+        self.actions = array('b')
+        self.costs = array('H')
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def add(self, code: int, parent: int, action: int, cost: int) -> int:
+        """Append a node and return its index."""
+        self.codes.append(code)
+        self.parents.append(parent)
+        self.actions.append(action)
+        self.costs.append(cost)
+        return len(self.codes) - 1
+
+    def chain(self, index: int) -> List[int]:
+        """Return the node indices from the root down to ``index``."""
+        parents = self.parents
+        nodes = []
+        while index != NO_PARENT:
+            nodes.append(index)
+            index = parents[index]
+        nodes.reverse()
+        return nodes
+
+    def path(self, index: int) -> List[str]:
+        """Return the actions from the root to node ``index``."""
+        return [ACTIONS[self.actions[node]] for node in self.chain(index)[1:]]
+
+    def to_state(self, index: int) -> PuzzleState:
+        """Materialise the path to node ``index`` as linked ``PuzzleState`` objects."""
+        state = None
+        for node in self.chain(index):
+            action = self.actions[node]
+            state = PuzzleState(list(decode(self.codes[node])), parent=state,
+                                action=ACTIONS[action] if action >= 0 else None,
+                                path_cost=self.costs[node])
+        return state
+
+
+def astar_search(initial_state: PuzzleState, stats: Optional[Dict[str, Union[int, str]]] = None,
+                 queue: str = 'heap', budget: Optional[Budget] = None) -> Optional[PuzzleState]:
+    """
+    A* search algorithm with the Manhattan distance heuristic. Returns the
+    goal as a ``PuzzleState`` linked to its ancestors (so ``path()`` works
+    as before), or None if the goal is unreachable.
+
+    The cheapest known path cost of every state is kept in ``best_g``, a
+    byte per permutation indexed by its rank: a child is pushed only if it
+    improves on it, and queue entries whose node has since been beaten are
+    skipped when popped. If a ``stats`` dict is
+    given, it is filled with the node and heap counters of the search.
+
+    ``queue`` selects the frontier: ``'heap'`` (a binary heap of
+    f << INDEX_BITS | node index) or ``'bucket'`` (an
+    ``ai_berkeley.utils.BucketQueue`` with O(1) push and pop that prefers
+    the deepest node among equal f).
+
+    A ``budget`` caps the search: every expansion counts as one iteration,
+    and a search that runs out returns None. ``stats`` then records the
+    budget's stop reason instead of ``'solved'`` or ``'exhausted'``. Only
+    ``max_iterations`` and ``time_limit`` apply; A* makes no evaluation
+    calls, so a budget with ``max_evaluations`` is rejected.
+    """
+    if queue not in ('heap', 'bucket'):
+        raise ValueError("Queue must be either 'heap' or 'bucket'.")
+    if budget is not None and budget.max_evaluations is not None:
+        raise ValueError("A* budgets limit iterations and time only, not max_evaluations.")
+    bucket = queue == 'bucket'
+    frontier = BucketQueue() if bucket else []
+
+    pool = NodePool()
+    best_g = bytearray([UNSEEN]) * NUM_PERMUTATIONS
+    delta_table = manhattan_delta_table(GOAL)
+    goal_code = encode(GOAL)
+    expanded = duplicates = stale = peak_frontier = 0
+    tracker = budget.start() if budget is not None else None
+    stop_reason = 'exhausted'
+
+    h_values = array('B')  # Manhattan distance of every node
+    ranks = array('I')  # best_g index of every node
+    start = encode(tuple(initial_state.board))
+    root = pool.add(start, NO_PARENT, -1, 0)
+    h_values.append(get_manhattan_distance(start))
+    ranks.append(rank_code(start))
+    best_g[ranks[root]] = 0
+    if bucket:
+        frontier.push(root, h_values[root], 0)
+    else:
+        heappush(frontier, h_values[root] << INDEX_BITS | root)
+
+    codes, parents, actions, costs = pool.codes, pool.parents, pool.actions, pool.costs
+    add_code, add_parent, add_action, add_cost = codes.append, parents.append, actions.append, costs.append
+    add_h = h_values.append
+    add_rank = ranks.append
+    action_codes = _ACTION_CODES
+    push = frontier.push if bucket else None
+    pop = frontier.pop if bucket else None
+    solution = None
     while frontier:
-        _, _, current = heappop(frontier)
-        
-        if current.is_goal():
-            return current
-        
-        board_tuple = tuple(current.board)
-        if board_tuple in explored:
+        current = pop() if bucket else heappop(frontier) & INDEX_MASK
+        code = codes[current]
+
+        if costs[current] > best_g[ranks[current]]:
+            stale += 1  # A cheaper copy was pushed after this one
             continue
-            
-        explored.add(board_tuple)
-        
-        for next_board, action in current.get_neighbors():
-            if tuple(next_board) not in explored:
-                child = PuzzleState(
-                    next_board,
-                    parent=current,
-                    action=action,
-                    path_cost=current.path_cost + 1
-                )
-                f = child.path_cost + child.manhattan_distance()
-                heappush(frontier, (f, id(child), child))
-    
-    return None  # No solution found
+
+        if code == goal_code:
+            solution = current
+            stop_reason = 'solved'
+            break
+
+        if tracker is not None and not tracker.next_iteration():
+            stop_reason = tracker.stop_reason
+            break
+
+        expanded += 1
+        blank = code >> BLANK_SHIFT
+        g = costs[current] + 1
+        h = h_values[current]
+        rank = ranks[current]
+        # Sliding back to the parent can never improve on its cost
+        back = codes[parents[current]] >> BLANK_SHIFT if current != root else NO_PARENT
+        for target, (factor, weight, radix, change, mids) in zip(TARGETS[blank], RANK_STEPS[blank]):
+            if target == back:
+                duplicates += 1
+                continue
+            shift = CELL_BITS * target
+            tile = (code >> shift) & CELL_MASK
+            child_code = (code - (tile << shift) + (tile << (CELL_BITS * blank))
+                          + ((target - blank) << BLANK_SHIFT))
+            # slide_rank, inlined
+            child_rank = rank + factor * (rank // weight % radix) + change
+            for mid_shift, mid_change in mids:
+                if (code >> mid_shift) & CELL_MASK < tile:
+                    child_rank += mid_change
+            if best_g[child_rank] <= g:
+                duplicates += 1
+                continue
+            best_g[child_rank] = g
+            child_h = h + delta_table[tile][target][blank]
+            child = len(codes)
+            add_code(child_code)
+            add_parent(current)
+            add_action(action_codes[target - blank])
+            add_cost(g)
+            add_h(child_h)
+            add_rank(child_rank)
+            if bucket:
+                push(child, g + child_h, g)
+            else:
+                heappush(frontier, (g + child_h) << INDEX_BITS | child)
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+    if stats is not None:
+        stats.update({
+            'Nodes Generated': len(pool),
+            'Nodes Expanded': expanded,
+            'Duplicates Suppressed': duplicates,
+            'Stale Pops': stale,
+            'Peak Frontier': peak_frontier,
+            'Stop Reason': stop_reason,
+        })
+    if solution is None:
+        return None  # No solution found
+    return pool.to_state(solution)
 
 def generate_solvable_puzzle() -> List[int]:
     """Generate a random solvable 8-puzzle instance."""
@@ -96,4 +276,4 @@ def generate_solvable_puzzle() -> List[int]:
         inversions = sum(1 for i in range(9) for j in range(i + 1, 9)
                         if puzzle[i] != 0 and puzzle[j] != 0 and puzzle[i] > puzzle[j])
         if inversions % 2 == 0:  # Puzzle is solvable
-            return puzzle 
\ No newline at end of file
+            return puzzle
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+IDA* for the n x n sliding-tile puzzle.
+
+Memory grows only with the solution depth: one board is modified in place
+with move/undo, the depth-first search runs on explicit stacks instead of
+recursion, and the move that would undo the previous one is never tried.
+"""
+from math import inf, isqrt
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from ..puzzle8.sliding import cell_distance, goal_state, is_solvable, move_table
+
+
+class ManhattanHeuristic:
+    """
+    Manhattan distance for an n x n goal. Besides scoring a whole board it
+    provides ``delta(tile, from_pos, to_pos)``, which IDA* uses to update
+    the estimate in O(1) per move.
+    """
+
+    def __init__(self, n: int, goal: Optional[Tuple[int, ...]] = None):
+        goal = goal or goal_state(n)
+        distance = cell_distance(n)
+        goal_pos = [0] * (n * n)
+        for pos, tile in enumerate(goal):
+            goal_pos[tile] = pos
+        # table[tile][pos]: distance of tile at pos from its goal cell
+        self.table = [[0 if tile == 0 else distance[pos][goal_pos[tile]] for pos in range(n * n)]
+                      for tile in range(n * n)]
+
+    def __call__(self, tiles: Sequence[int]) -> int:
+        table = self.table
+        return sum(table[tile][pos] for pos, tile in enumerate(tiles))
+
+    def delta(self, tile: int, from_pos: int, to_pos: int) -> int:
+        row = self.table[tile]
+        return row[to_pos] - row[from_pos]
+
+
+class LinearConflictHeuristic:
+    """
+    Manhattan distance plus two moves for every tile that has to leave its
+    goal row or column to let another tile in that line pass. The tiles to
+    move out of a line are those outside a longest run already in goal
+    order, which keeps the estimate admissible.
+    """
+
+    def __init__(self, n: int, goal: Optional[Tuple[int, ...]] = None):
+        goal = goal or goal_state(n)
+        self.n = n
+        self.manhattan = ManhattanHeuristic(n, goal)
+        self.goal_pos = [0] * (n * n)
+        for pos, tile in enumerate(goal):
+            self.goal_pos[tile] = pos
+
+    @staticmethod
+    def _conflicts(order: List[int]) -> int:
+        """Tiles outside a longest increasing subsequence of ``order``."""
+        if len(order) < 2:
+            return 0
+        longest = [1] * len(order)
+        for i in range(1, len(order)):
+            for j in range(i):
+                if order[j] < order[i] and longest[j] + 1 > longest[i]:
+                    longest[i] = longest[j] + 1
+        return len(order) - max(longest)
+
+    def __call__(self, tiles: Sequence[int]) -> int:
+        n = self.n
+        goal_pos = self.goal_pos
+        extra = 0
+        for line in range(n):
+            row_order = []
+            col_order = []
+            for k in range(n):
+                tile = tiles[line * n + k]
+                if tile and goal_pos[tile] // n == line:
+                    row_order.append(goal_pos[tile] % n)
+                tile = tiles[k * n + line]
+                if tile and goal_pos[tile] % n == line:
+                    col_order.append(goal_pos[tile] // n)
+            extra += self._conflicts(row_order) + self._conflicts(col_order)
+        return self.manhattan(tiles) + 2 * extra
+
+
+HEURISTICS = {
+    'manhattan': ManhattanHeuristic,
+    'linear_conflict': LinearConflictHeuristic,
+}
+
+
+def ida_star_search(
+    board: Sequence[int],
+    heuristic: Union[str, Callable[[Sequence[int]], int]] = 'manhattan',
+    goal: Optional[Tuple[int, ...]] = None,
+    max_threshold: float = inf
+) -> Optional[List[str]]:
+    """
+    Solve an n x n sliding puzzle optimally with IDA*.
+
+    ``heuristic`` is ``'manhattan'``, ``'linear_conflict'`` or any admissible
+    callable on a board, such as ``puzzle8.pattern_db.PatternDatabaseHeuristic``.
+    Returns the blank's moves ('up', 'down', 'left', 'right') like
+    ``PuzzleState.path()``, or None if the board cannot reach the goal or
+    no solution costs at most ``max_threshold``. Unsolvable boards are
+    detected up front by their permutation parity; searching them would
+    never end.
+    """
+    tiles = list(board)
+    n = isqrt(len(tiles))
+    if n * n != len(tiles):
+        raise ValueError(f"Board of length {len(tiles)} is not square")
+    goal = goal or goal_state(n)
+    if not is_solvable(tuple(tiles), n, goal):
+        return None
+    if isinstance(heuristic, str):
+        heuristic = HEURISTICS[heuristic](n, goal)
+    delta = getattr(heuristic, 'delta', None)
+    targets = move_table(n)
+    action_names = {-n: 'up', n: 'down', -1: 'left', 1: 'right'}
+    goal_tiles = list(goal)
+
+    start_blank = tiles.index(0)
+    start_h = heuristic(tiles)
+    threshold = start_h
+    while threshold <= max_threshold:
+        next_threshold = inf
+        blank = start_blank
+        # One entry per node on the current path: blank before the move that
+        # led here (the parent's blank), heuristic value, next move to try
+        parents: List[int] = []
+        h_values = [start_h]
+        next_moves = [0]
+        entering = True
+        while True:
+            h = h_values[-1]
+            depth = len(parents)
+            if entering:
+                entering = False
+                f = depth + h
+                if f > threshold:
+                    next_threshold = min(next_threshold, f)
+                    next_moves[-1] = len(targets[blank])  # Prune this node
+                elif h == 0 and tiles == goal_tiles:
+                    actions = []
+                    for i, parent in enumerate(parents):
+                        child = parents[i + 1] if i + 1 < len(parents) else blank
+                        actions.append(action_names[child - parent])
+                    return actions
+
+            options = targets[blank]
+            i = next_moves[-1]
+            parent = parents[-1] if parents else -1
+            while i < len(options) and options[i] == parent:
+                i += 1
+            if i < len(options):
+                next_moves[-1] = i + 1
+                target = options[i]
+                tile = tiles[target]
+                tiles[blank] = tile
+                tiles[target] = 0
+                if delta is not None:
+                    h_values.append(h + delta(tile, target, blank))
+                else:
+                    h_values.append(heuristic(tiles))
+                parents.append(blank)
+                next_moves.append(0)
+                blank = target
+                entering = True
+                continue
+
+            # All moves tried: undo the move that led here
+            if not parents:
+                break
+            h_values.pop()
+            next_moves.pop()
+            parent = parents.pop()
+            tiles[blank] = tiles[parent]
+            tiles[parent] = 0
+            blank = parent
+
+        if next_threshold == inf:
+            return None
+        threshold = next_threshold
+    return None
@@ -0,0 +1,69 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..local_search.budget import Budget
+from ..puzzle8.oracle import DistanceOracle
+from ..puzzle8.sliding import random_instance
+from .astar_search import PuzzleState, astar_search
+from .test_ida_star import apply_actions
+
+STATS_KEYS = {'Nodes Generated', 'Nodes Expanded', 'Duplicates Suppressed', 'Stale Pops',
+              'Peak Frontier', 'Stop Reason'}
+
+
+class TestAstarSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.oracle = DistanceOracle(path=Path(cls.directory.name) / 'distances.npy')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_paths_are_optimal(self):
+        """Both frontiers return legal paths as long as the oracle's distance."""
+        rng = random.Random(0)
+        boards = [random_instance(3, rng) for _ in range(20)] + [(8, 0, 6, 5, 4, 7, 2, 3, 1)]
+        for board in boards:
+            for queue in ('heap', 'bucket'):
+                stats = {}
+                goal = astar_search(PuzzleState(list(board)), stats, queue)
+                actions = goal.path()
+                self.assertEqual(len(actions), self.oracle(board))
+                self.assertEqual(goal.path_cost, len(actions))
+                self.assertEqual(apply_actions(board, actions), self.oracle.goal)
+                self.assertEqual(set(stats), STATS_KEYS)
+                self.assertEqual(stats['Stop Reason'], 'solved')
+                self.assertLessEqual(stats['Nodes Expanded'], stats['Nodes Generated'])
+                self.assertGreaterEqual(stats['Peak Frontier'], 1 if actions else 0)
+
+    def test_solved_board(self):
+        stats = {}
+        goal = astar_search(PuzzleState(list(range(9))), stats)
+        self.assertEqual(goal.path(), [])
+        self.assertEqual((stats['Nodes Generated'], stats['Nodes Expanded']), (1, 0))
+
+    def test_budget(self):
+        board = [8, 0, 6, 5, 4, 7, 2, 3, 1]
+        stats = {}
+        self.assertIsNone(astar_search(PuzzleState(board), stats, budget=Budget(max_iterations=100)))
+        self.assertEqual(stats['Stop Reason'], 'max_iterations')
+        self.assertEqual(stats['Nodes Expanded'], 100)
+        with self.assertRaises(ValueError):
+            astar_search(PuzzleState(board), budget=Budget(max_evaluations=10))
+        with self.assertRaises(ValueError):
+            astar_search(PuzzleState(board), queue='stack')
+
+    def test_unsolvable_board_exhausts(self):
+        """All 9!/2 reachable states are expanded exactly once before giving up."""
+        stats = {}
+        self.assertIsNone(astar_search(PuzzleState([0, 2, 1, 3, 4, 5, 6, 7, 8]), stats, 'bucket'))
+        self.assertEqual(stats['Stop Reason'], 'exhausted')
+        self.assertEqual(stats['Nodes Expanded'], 181440)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..puzzle8.oracle import DistanceOracle
+from ..puzzle8.sliding import random_instance
+from .ida_star import ida_star_search
+
+MOVES = {'up': -3, 'down': 3, 'left': -1, 'right': 1}
+
+
+def apply_actions(board, actions):
+    """Play the blank's moves on a copy of an 8-puzzle board."""
+    tiles = list(board)
+    for action in actions:
+        blank = tiles.index(0)
+        target = blank + MOVES[action]
+        tiles[blank], tiles[target] = tiles[target], 0
+    return tuple(tiles)
+
+
+class TestIdaStarSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.oracle = DistanceOracle(path=Path(cls.directory.name) / 'distances.npy')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_solutions_are_optimal(self):
+        """Both built-in heuristics return optimal, legal solutions."""
+        rng = random.Random(0)
+        for _ in range(15):
+            board = random_instance(3, rng)
+            for heuristic in ('manhattan', 'linear_conflict'):
+                actions = ida_star_search(board, heuristic)
+                self.assertEqual(len(actions), self.oracle(board))
+                self.assertEqual(apply_actions(board, actions), self.oracle.goal)
+
+    def test_solved_board(self):
+        self.assertEqual(ida_star_search(tuple(range(9))), [])
+
+    def test_unsolvable_board_returns_none(self):
+        """Boards of the wrong parity return None instead of searching forever."""
+        self.assertIsNone(ida_star_search((0, 2, 1, 3, 4, 5, 6, 7, 8)))
+        self.assertIsNone(ida_star_search((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14)))
+
+    def test_max_threshold(self):
+        board = (1, 2, 0, 3, 4, 5, 6, 7, 8)
+        self.assertIsNone(ida_star_search(board, max_threshold=1))
+        self.assertEqual(len(ida_star_search(board, max_threshold=2)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()